@@ -1,21 +1,28 @@
 import os
+import re
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import HTTPException, APIRouter
 from fastapi.responses import JSONResponse
-from web3 import Web3
+from web3.exceptions import TransactionNotFound
 
 from models import (
     AaveRequest, SupplyResponse, BorrowResponse, RepayResponse,
-    BalanceResponse, HealthResponse, SimulateResponse, TokenBalance,
+    BalanceResponse, HealthResponse, HealthBatchRequest, HealthBatchResponse, SimulateResponse, TokenBalance,
     TransactionRequest, TransactionResponse, ExecuteTransactionRequest
 )
-from contracts import init_web3, get_pool_contract, get_token_contract, get_pool_address, build_pool_transaction
+from contracts import (
+    init_web3, get_pool_contract, get_pool_address, build_pool_transaction,
+    execute_call, execute_multicall, send_raw_transaction_sync, get_transaction_receipt
+)
 from utils import (
     log_to_hedera, schedule_log, get_health_factor,
     amount_to_wei, validate_user_address, build_transaction,
     build_approval_transaction, estimate_gas_cost, get_token_allowance,
-    get_token_decimals
+    get_token_decimals, get_gas_price, get_next_nonce,
+    build_balance_call, format_token_amount, GAS_LIMITS, get_fee_params,
+    get_health_factors, build_user_account_data_call, MAX_UINT256
 )
 from oracle import (
     get_real_time_token_price, get_real_time_liquidation_threshold,
@@ -24,12 +31,19 @@ from oracle import (
 
 router = APIRouter()
 
+# Runs independent reads of a single request concurrently
+_read_executor = ThreadPoolExecutor(max_workers=8)
+
+TX_HASH_PATTERN = re.compile(r"^0x[0-9a-fA-F]{64}$")
+
 # ============================================================
 # API ENDPOINTS
 # ============================================================
+# Handlers are plain `def` on purpose: they make blocking web3 calls, so
+# FastAPI runs them in its worker threadpool instead of on the event loop.
 
 @router.post("/supply", response_model=SupplyResponse)
-async def supply(req: AaveRequest):
+def supply(req: AaveRequest):
     """Supply tokens - build transaction for user to sign."""
     try:
         w3, _, cfg = init_web3(req.network, with_executor=False)
@@ -43,35 +57,59 @@ async def supply(req: AaveRequest):
         pool_addr = get_pool_address(w3, provider_addr)
         amount_wei = amount_to_wei(req.amount, token, cfg)
 
-        # Check if approval is needed
+        # Fee data doesn't depend on the allowance read, so fetch it alongside it
+        fee_future = _read_executor.submit(get_fee_params, w3)
+
+        # Check if approval is needed; a signed permit replaces the approval transaction
+        approval_needed = False
+        if req.permit is None and asset_data["underlying"] != "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeEee":
+            allowance = get_token_allowance(w3, asset_data["underlying"], user, pool_addr)
+            approval_needed = allowance < amount_wei
+
+        # Resolving the fee future here also leaves the approval build a warm fee cache
+        fee_params = fee_future.result()
+
+        # One nonce read covers both transactions: approval gets N, supply gets N+1
+        nonce = get_next_nonce(w3, user)
         approval_tx_data = None
-        if asset_data["underlying"] != "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeEee":
-            current_allowance = get_token_allowance(w3, asset_data["underlying"], user, pool_addr)
-            if current_allowance < amount_wei:
-                approval_tx_data = build_approval_transaction(
-                    w3, user, asset_data["underlying"], pool_addr, amount_wei, cfg["chain_id"]
-                )
+        if approval_needed:
+            # Approve once for max uint so later supplies of this token skip the approval leg
+            approval_tx_data = build_approval_transaction(
+                w3, user, asset_data["underlying"], pool_addr, MAX_UINT256, cfg["chain_id"], nonce=nonce
+            )
+            nonce += 1
 
         # Build supply transaction
-        tx_data = build_pool_transaction(
-            w3, provider_addr, "supply",
-            asset_data["underlying"], amount_wei, user, 0
-        )
+        if req.permit:
+            operation = "supplyWithPermit"
+            tx_data = build_pool_transaction(
+                w3, provider_addr, operation,
+                asset_data["underlying"], amount_wei, user, 0,
+                req.permit.deadline, req.permit.v,
+                bytes.fromhex(req.permit.r.removeprefix("0x")), bytes.fromhex(req.permit.s.removeprefix("0x"))
+            )
+        else:
+            operation = "supply"
+            tx_data = build_pool_transaction(
+                w3, provider_addr, operation,
+                asset_data["underlying"], amount_wei, user, 0
+            )
 
         # Complete transaction
         transaction = {
             "to": tx_data["to"],
             "data": tx_data["data"],
             "from": user,
-            "nonce": w3.eth.get_transaction_count(user),
+            "nonce": nonce,
             "chainId": cfg["chain_id"],
-            "gas": tx_data.get("gas", 300000),
-            "value": tx_data.get("value", 0)
+            "gas": GAS_LIMITS[operation],
+            "value": tx_data.get("value", 0),
+            **fee_params
         }
 
         gas_cost = estimate_gas_cost(w3, transaction["gas"])
 
-        msg = f"Built supply transaction for {req.amount} {token} on {req.network} for {user}"
+        msg = f"Built {operation} transaction for {req.amount} {token} on {req.network} for {user}"
         schedule_log(msg)
 
         return {
@@ -81,7 +119,7 @@ async def supply(req: AaveRequest):
                 "transaction": transaction,
                 "approval_transaction": approval_tx_data,
                 "gas_cost": gas_cost,
-                "note": "Please sign the approval transaction first (if provided), then sign the supply transaction"
+                "note": "Please sign the approval transaction first (if provided), then sign the supply transaction. Both can be submitted back-to-back; pass wait_for_receipt=false for the approval"
             }
         }
 
@@ -91,7 +129,7 @@ async def supply(req: AaveRequest):
 
 
 @router.post("/borrow", response_model=BorrowResponse)
-async def borrow(req: AaveRequest):
+def borrow(req: AaveRequest):
     """Borrow tokens safely with health factor check - build transaction for user to sign."""
     try:
         w3, _, cfg = init_web3(req.network, with_executor=False)
@@ -102,6 +140,9 @@ async def borrow(req: AaveRequest):
         provider_addr = cfg["pool_provider"]
         pool = get_pool_contract(w3, provider_addr)
         user = validate_user_address(req.user_address)
+
+        # Fee data doesn't depend on the health check, so fetch it alongside it
+        fee_future = _read_executor.submit(get_fee_params, w3)
         hf = get_health_factor(pool, user)
 
         if hf < 1.1:
@@ -123,10 +164,11 @@ async def borrow(req: AaveRequest):
             "to": tx_data["to"],
             "data": tx_data["data"],
             "from": user,
-            "nonce": w3.eth.get_transaction_count(user),
+            "nonce": get_next_nonce(w3, user),
             "chainId": cfg["chain_id"],
-            "gas": tx_data.get("gas", 400000),  # Borrow operations might need more gas
-            "value": tx_data.get("value", 0)
+            "gas": GAS_LIMITS["borrow"],
+            "value": tx_data.get("value", 0),
+            **fee_future.result()
         }
 
         gas_cost = estimate_gas_cost(w3, transaction["gas"])
@@ -151,7 +193,7 @@ async def borrow(req: AaveRequest):
 
 
 @router.post("/repay", response_model=RepayResponse)
-async def repay(req: AaveRequest):
+def repay(req: AaveRequest):
     """Repay borrowed tokens - build transaction for user to sign."""
     try:
         w3, _, cfg = init_web3(req.network, with_executor=False)
@@ -175,10 +217,11 @@ async def repay(req: AaveRequest):
             "to": tx_data["to"],
             "data": tx_data["data"],
             "from": user,
-            "nonce": w3.eth.get_transaction_count(user),
+            "nonce": get_next_nonce(w3, user),
             "chainId": cfg["chain_id"],
-            "gas": tx_data.get("gas", 350000),
-            "value": tx_data.get("value", 0)
+            "gas": GAS_LIMITS["repay"],
+            "value": tx_data.get("value", 0),
+            **get_fee_params(w3)
         }
 
         gas_cost = estimate_gas_cost(w3, transaction["gas"])
@@ -202,33 +245,64 @@ async def repay(req: AaveRequest):
 
 
 @router.get("/health/{network}/{user}", response_model=HealthResponse)
-async def health(network: str, user: str):
+def health(network: str, user: str):
     """Get user's health factor and borrowing safety status."""
     w3, _, cfg = init_web3(network)
-    pool = get_pool_contract(w3, Web3.to_checksum_address(cfg["pool_provider"]))
+    pool = get_pool_contract(w3, cfg["pool_provider"])
     user_address = validate_user_address(user)
     hf = get_health_factor(pool, user_address)
     return {"health_factor": hf, "safe_to_borrow": hf >= 1.1}
 
 
+@router.post("/health/batch", response_model=HealthBatchResponse)
+def health_batch(req: HealthBatchRequest):
+    """Get health factors for several users in a single Multicall3 read."""
+    try:
+        users = [validate_user_address(user) for user in req.user_addresses]
+    except ValueError as e:
+        raise HTTPException(400, f"Invalid user address: {e}")
+
+    try:
+        w3, _, cfg = init_web3(req.network)
+        health_factors = get_health_factors(w3, get_pool_address(w3, cfg["pool_provider"]), users)
+        return {
+            "network": req.network,
+            "users": {
+                user: None if hf is None else {"health_factor": hf, "safe_to_borrow": hf >= 1.1}
+                for user, hf in health_factors.items()
+            },
+        }
+
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(500, str(e))
+
+
 @router.get("/balance/{network}/{user}", response_model=BalanceResponse)
-async def balance(network: str, user: str):
+def balance(network: str, user: str):
     """Get token balances for a user on a specific network including all token types."""
     w3, _, cfg = init_web3(network)
     user_address = validate_user_address(user)
 
-    # ERC20 ABI for balanceOf function
-    erc20_abi = [
-        {
-            "name": "balanceOf",
-            "inputs": [{"type": "address"}],
-            "outputs": [{"type": "uint256"}],
-            "stateMutability": "view",
-            "type": "function"
-        }
-    ]
+    # Every underlying / aToken / vToken balanceOf goes into one Multicall3 eth_call
+    balance_calls = []
+    for asset_data in cfg["assets"].values():
+        for token_address in (asset_data["underlying"], asset_data.get("a_token"), asset_data.get("v_token")):
+            if token_address:
+                balance_calls.append(build_balance_call(token_address, user_address))
+
+    try:
+        raw_balances = execute_multicall(w3, balance_calls)
+    except Exception:
+        # Multicall3 unavailable - fall back to one eth_call per balance
+        raw_balances = []
+        for call in balance_calls:
+            try:
+                raw_balances.append(execute_call(w3, call))
+            except Exception:
+                raw_balances.append(0)
+    raw_balances = iter(raw_balances)
 
-  
     tokens = {}
     total_supply_value = 0
     total_borrow_value = 0
@@ -241,36 +315,20 @@ async def balance(network: str, user: str):
         token_info.aToken_address = asset_data.get("a_token")
         token_info.vToken_address = asset_data.get("v_token")
 
-        # Check underlying token balance
-        try:
-            underlying_token = get_token_contract(w3, asset_data["underlying"])
-            raw_balance = underlying_token.functions.balanceOf(user_address).call()
-            from utils import format_token_amount
-            token_info.underlying = format_token_amount(raw_balance, token_symbol, cfg)
-        except Exception:
-            token_info.underlying = 0
+        # Underlying token balance
+        token_info.underlying = format_token_amount(next(raw_balances), token_symbol, cfg)
 
-        # Check aToken balance
+        # aToken balance
         if token_info.aToken_address:
-            try:
-                a_token = w3.eth.contract(address=token_info.aToken_address, abi=erc20_abi)
-                raw_balance = a_token.functions.balanceOf(user_address).call()
-                token_info.aToken = format_token_amount(raw_balance, token_symbol, cfg)
-                # Approximate supply value (simplified - assumes 1:1 with underlying)
-                total_supply_value += token_info.aToken
-            except Exception:
-                token_info.aToken = 0
+            token_info.aToken = format_token_amount(next(raw_balances), token_symbol, cfg)
+            # Approximate supply value (simplified - assumes 1:1 with underlying)
+            total_supply_value += token_info.aToken
 
-        # Check vToken balance
+        # vToken balance
         if token_info.vToken_address:
-            try:
-                v_token = w3.eth.contract(address=token_info.vToken_address, abi=erc20_abi)
-                raw_balance = v_token.functions.balanceOf(user_address).call()
-                token_info.vToken = format_token_amount(raw_balance, token_symbol, cfg)
-                # Approximate borrow value (simplified)
-                total_borrow_value += token_info.vToken
-            except Exception:
-                token_info.vToken = 0
+            token_info.vToken = format_token_amount(next(raw_balances), token_symbol, cfg)
+            # Approximate borrow value (simplified)
+            total_borrow_value += token_info.vToken
 
         tokens[token_symbol] = token_info
 
@@ -310,11 +368,11 @@ def get_cached_real_time_data(network: str, cfg: dict, cache_duration: int = 60)
 
 
 @router.post("/simulate", response_model=SimulateResponse)
-async def simulate(req: AaveRequest):
+def simulate(req: AaveRequest):
     """Dry-run simulation of supply or borrow to estimate health factor effect."""
     w3, _, cfg = init_web3(req.network)
     user = validate_user_address(req.user_address)
-    pool = get_pool_contract(w3, Web3.to_checksum_address(cfg["pool_provider"]))
+    pool = get_pool_contract(w3, cfg["pool_provider"])
     token = req.token.upper()
 
     if token not in cfg["assets"]:
@@ -337,6 +395,9 @@ async def simulate(req: AaveRequest):
             # Convert negative amount to positive for borrow
             req.amount = abs(req.amount)
 
+    # Asset data is independent of the account read, so fetch it alongside it
+    real_time_future = _read_executor.submit(get_all_real_time_asset_data, req.network, cfg)
+
     # Get current account data
     try:
         # Debug pool contract info
@@ -345,7 +406,7 @@ async def simulate(req: AaveRequest):
         print(f"[DEBUG] Network: {req.network}")
         print(f"[DEBUG] User Address: {user}")
 
-        account_data = pool.functions.getUserAccountData(user).call()
+        account_data = execute_call(w3, build_user_account_data_call(pool_address, user))
         total_collateral_base = account_data[0]  # Total collateral in base currency (not scaled by 1e18)
         total_debt_base = account_data[1]        # Total debt in base currency (not scaled by 1e18)
         available_borrows_base = account_data[2]  # Available borrowing capacity (not scaled by 1e18)
@@ -388,9 +449,9 @@ async def simulate(req: AaveRequest):
 
         # Debug: Check if we can get LTV from real-time data
         try:
-            real_time_data = get_all_real_time_asset_data(req.network, cfg)
-            if token_symbol in real_time_data:
-                real_ltv = real_time_data[token_symbol].get("ltv", 0)
+            real_time_data = real_time_future.result()
+            if token in real_time_data:
+                real_ltv = real_time_data[token].get("ltv", 0)
                 print(f"  Real-time LTV for {token}: {real_ltv:.4f} ({real_ltv*100:.2f}%)")
         except Exception as e:
             print(f"[DEBUG] Could not get real-time LTV data: {e}")
@@ -414,7 +475,7 @@ async def simulate(req: AaveRequest):
 
     # Get real-time asset data from Aave protocol (includes both LTV and liquidation threshold)
     print(f"[DEBUG] Fetching real-time asset data for {token}...")
-    real_time_data = get_all_real_time_asset_data(req.network, cfg)
+    real_time_data = real_time_future.result()
 
     token_lt = 0.80  # Default liquidation threshold
     token_ltv = 0.0  # Default LTV
@@ -459,7 +520,7 @@ async def simulate(req: AaveRequest):
 
         # For supply, calculate the token value in base currency correctly
         # Step 1: Convert human-readable amount to token wei (respecting token decimals)
-        token_amount_wei = int(req.amount * (10 ** token_decimals))
+        token_amount_wei = amount_to_wei(req.amount, token, cfg)
 
         # Step 2: Convert token wei to human-readable amount for USD calculation
         token_amount_human = token_amount_wei / (10 ** token_decimals)
@@ -512,7 +573,7 @@ async def simulate(req: AaveRequest):
 
         # Calculate the USD value of the token being borrowed correctly
         # Step 1: Convert human-readable amount to token wei (respecting token decimals)
-        token_amount_wei = int(borrow_amount * (10 ** token_decimals))
+        token_amount_wei = amount_to_wei(borrow_amount, token, cfg)
 
         # Step 2: Convert token wei to human-readable amount for USD calculation
         token_amount_human = token_amount_wei / (10 ** token_decimals)
@@ -596,7 +657,7 @@ async def simulate(req: AaveRequest):
 
 
 @router.get("/prices/{network}")
-async def get_real_time_prices(network: str):
+def get_real_time_prices(network: str):
     """Get real-time prices for all supported tokens on a network."""
     try:
         w3, _, cfg = init_web3(network)
@@ -626,7 +687,7 @@ async def get_real_time_prices(network: str):
         raise HTTPException(500, f"Failed to get real-time prices: {str(e)}")
 
 @router.post("/build/transaction", response_model=TransactionResponse)
-async def build_transaction_endpoint(req: TransactionRequest):
+def build_transaction_endpoint(req: TransactionRequest):
     """Build transaction data for user to sign."""
     try:
         w3, _, cfg = init_web3(req.network, with_executor=False)
@@ -640,18 +701,28 @@ async def build_transaction_endpoint(req: TransactionRequest):
         pool_addr = get_pool_address(w3, provider_addr)
         amount_wei = amount_to_wei(req.amount, token, cfg)
 
-        # For supply operations, check if approval is needed
-        approval_tx_data = None
+        # Fee data doesn't depend on the allowance read, so fetch it alongside it
+        fee_future = _read_executor.submit(get_fee_params, w3)
 
         # Only supply operations need approval (borrow/repay don't need token approval)
         # Supply operations need to transfer tokens to Aave pool
+        approval_needed = False
         if asset_data["underlying"] != "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeEee":  # Not native token
-            current_allowance = get_token_allowance(w3, asset_data["underlying"], user, pool_addr)
-            if current_allowance < amount_wei:
-                # Build approval transaction
-                approval_tx_data = build_approval_transaction(
-                    w3, user, asset_data["underlying"], pool_addr, amount_wei, cfg["chain_id"]
-                )
+            allowance = get_token_allowance(w3, asset_data["underlying"], user, pool_addr)
+            approval_needed = allowance < amount_wei
+
+        # Resolving the fee future here also leaves the approval build a warm fee cache
+        fee_params = fee_future.result()
+
+        # One nonce read covers both transactions: approval gets N, the main transaction N+1
+        nonce = get_next_nonce(w3, user)
+        approval_tx_data = None
+        if approval_needed:
+            # Build a max-uint approval so later transactions of this token skip it
+            approval_tx_data = build_approval_transaction(
+                w3, user, asset_data["underlying"], pool_addr, MAX_UINT256, cfg["chain_id"], nonce=nonce
+            )
+            nonce += 1
 
         # Determine action type - for simplicity, default to supply
         # In a real implementation, you'd have separate endpoints or an action parameter
@@ -672,10 +743,11 @@ async def build_transaction_endpoint(req: TransactionRequest):
             "to": tx_data["to"],
             "data": tx_data["data"],
             "from": user,
-            "nonce": w3.eth.get_transaction_count(user),
+            "nonce": nonce,
             "chainId": cfg["chain_id"],
-            "gas": tx_data.get("gas", 300000),  # Default gas limit
-            "value": tx_data.get("value", 0)
+            "gas": GAS_LIMITS[action],
+            "value": tx_data.get("value", 0),
+            **fee_params
         }
 
         # Estimate gas cost
@@ -700,16 +772,20 @@ async def build_transaction_endpoint(req: TransactionRequest):
 
 
 @router.post("/execute/transaction")
-async def execute_transaction_endpoint(req: ExecuteTransactionRequest):
+def execute_transaction_endpoint(req: ExecuteTransactionRequest):
     """Execute a signed transaction from user."""
     try:
         w3, _, cfg = init_web3(req.network, with_executor=False)
 
-        # Send the signed transaction
-        tx_hash = w3.eth.send_raw_transaction(req.signed_transaction)
+        if not req.wait_for_receipt:
+            # Fire-and-forget: the approval (nonce N) and supply (nonce N+1) can be submitted
+            # back-to-back and the sequencer orders them, so don't idle a block between the two
+            tx_hash, _ = send_raw_transaction_sync(w3, req.signed_transaction, wait=False)
+            schedule_log(f"Submitted transaction on {req.network}: {tx_hash.hex()}")
+            return {"status": "pending", "tx_hash": tx_hash.hex()}
 
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+        # Send the signed transaction and wait for its receipt
+        tx_hash, receipt = send_raw_transaction_sync(w3, req.signed_transaction)
 
         msg = f"Executed transaction on {req.network}: {tx_hash.hex()}, status={receipt.status}"
         schedule_log(msg)
@@ -730,8 +806,43 @@ async def execute_transaction_endpoint(req: ExecuteTransactionRequest):
         raise HTTPException(500, str(e))
 
 
+@router.get("/tx/{network}/{tx_hash}")
+def get_transaction_status(network: str, tx_hash: str):
+    """Poll the status of a transaction submitted with wait_for_receipt=false.
+
+    Returns "pending" while the node knows the transaction but it is not mined yet, and
+    "not_found" when the node has never seen the hash or has dropped it from its mempool.
+    """
+    if not TX_HASH_PATTERN.match(tx_hash):
+        raise HTTPException(400, f"Invalid transaction hash: {tx_hash}")
+
+    try:
+        w3, _, cfg = init_web3(network, with_executor=False)
+        receipt = get_transaction_receipt(w3, tx_hash)
+        if receipt is None:
+            try:
+                w3.eth.get_transaction(tx_hash)
+            except TransactionNotFound:
+                return {"status": "not_found", "tx_hash": tx_hash}
+            return {"status": "pending", "tx_hash": tx_hash}
+
+        return {
+            "status": "success" if receipt.status == 1 else "failed",
+            "tx_hash": tx_hash,
+            "block_number": receipt.blockNumber,
+            "gas_used": receipt.gasUsed,
+            "effective_gas_price": receipt.effectiveGasPrice
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(500, str(e))
+
+
 @router.get("/gas/estimate/{network}/{token}/{amount}")
-async def estimate_gas(network: str, token: str, amount: float):
+def estimate_gas(network: str, token: str, amount: float):
     """Estimate gas costs for transactions."""
     try:
         w3, _, cfg = init_web3(network, with_executor=False)
@@ -743,37 +854,16 @@ async def estimate_gas(network: str, token: str, amount: float):
         provider_addr = cfg["pool_provider"]
         amount_wei = amount_to_wei(amount, token_symbol, cfg)
 
-        # Estimate supply transaction gas
+        # Estimate supply transaction gas from the same hand-built calldata the builders use
         try:
+            zero_address = "0x0000000000000000000000000000000000000000"
             tx_data = build_pool_transaction(
                 w3, provider_addr, "supply",
-                asset_data["underlying"], amount_wei,
-                validate_user_address("0x0000000000000000000000000000000000000000"), 0
+                asset_data["underlying"], amount_wei, zero_address, 0
             )
-
-            # Get more accurate gas estimate
-            pool_addr = get_pool_address(w3, provider_addr)
-            pool_abi = [
-                {
-                    "inputs": [
-                        {"type": "address", "name": "asset"},
-                        {"type": "uint256", "name": "amount"},
-                        {"type": "address", "name": "onBehalfOf"},
-                        {"type": "uint16", "name": "referralCode"},
-                    ],
-                    "name": "supply",
-                    "outputs": [],
-                    "stateMutability": "nonpayable",
-                    "type": "function",
-                }
-            ]
-            pool_contract = w3.eth.contract(address=pool_addr, abi=pool_abi)
-            gas_estimate = pool_contract.functions.supply(
-                asset_data["underlying"], amount_wei,
-                validate_user_address("0x0000000000000000000000000000000000000000"), 0
-            ).estimate_gas({'from': validate_user_address("0x0000000000000000000000000000000000000000")})
+            gas_estimate = w3.eth.estimate_gas({"from": zero_address, "to": tx_data["to"], "data": tx_data["data"]})
         except Exception:
-            gas_estimate = 300000  # Fallback estimate
+            gas_estimate = GAS_LIMITS["supply"]  # Fallback estimate
 
         # Estimate gas cost
         gas_cost = estimate_gas_cost(w3, gas_estimate)
@@ -782,7 +872,7 @@ async def estimate_gas(network: str, token: str, amount: float):
         approval_gas = 0
         approval_cost = 0
         if asset_data["underlying"] != "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeEee":
-            approval_gas = 50000  # Standard approval gas
+            approval_gas = GAS_LIMITS["approve"]
             approval_cost = estimate_gas_cost(w3, approval_gas)
 
         return {
@@ -796,7 +886,7 @@ async def estimate_gas(network: str, token: str, amount: float):
             "total_gas_estimate": gas_estimate + approval_gas,
             "total_gas_cost": gas_cost + approval_cost,
             "needs_approval": approval_gas > 0,
-            "gas_price_gwei": float(w3.from_wei(w3.eth.gas_price, 'gwei'))
+            "gas_price_gwei": float(w3.from_wei(get_gas_price(w3), 'gwei'))
         }
 
     except Exception as e:
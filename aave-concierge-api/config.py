@@ -13,6 +13,9 @@ ALCHEMY_API_KEY = os.getenv("ALCHEMY_API_KEY")
 EXECUTOR_PRIVATE_KEY = os.getenv("EXECUTOR_PRIVATE_KEY")
 HEDERA_LOGGER_URL = os.getenv("HEDERA_LOGGER_URL", "https://aave-guard-mcp.vercel.app/api/hedera")
 DEFAULT_NETWORK = os.getenv("NETWORK", "base-sepolia").lower()
+# Client-side JSON-RPC budget in Alchemy compute units per second, shared by all networks.
+# Off by default (0); when set, RPC calls block in their worker thread until budget is available.
+RPC_CU_PER_SECOND = int(os.getenv("RPC_CU_PER_SECOND", "0"))
 
 if not (ALCHEMY_API_KEY and EXECUTOR_PRIVATE_KEY):
     raise ValueError("Missing ALCHEMY_API_KEY or EXECUTOR_PRIVATE_KEY in .env")
@@ -165,6 +168,7 @@ def load_network_configurations():
                 "chain_id": chain_id,
                 "rpc": rpc,
                 "pool_provider": network_data["POOL_ADDRESSES_PROVIDER"],
+                "pool": network_data.get("POOL"),  # Pool proxy, so it needs no getPool() lookup
                 "AAVE_PROTOCOL_DATA_PROVIDER": pdp_address,
                 "assets": assets,
                 "oracle": network_data.get("ORACLE"),  # Network-level oracle address
@@ -191,6 +195,7 @@ def get_fallback_config():
             "chain_id": 84532,
             "rpc": f"https://base-sepolia.g.alchemy.com/v2/{ALCHEMY_API_KEY}",
             "pool_provider": "0xE4C23309117Aa30342BFaae6c95c6478e0A4Ad00",
+            "pool": "0x8bAB6d1b75f19e9eD9fCe8b9BD338844fF79aE27",
             "AAVE_PROTOCOL_DATA_PROVIDER": "0xBc9f5b7E248451CdD7cA54e717a2BFe1F32b566b",
             "oracle": "0x943b0dE18d4abf4eF02A85912F8fc07684C141dF",
             "assets": {
@@ -242,6 +247,7 @@ def get_fallback_config():
             "chain_id": 11155111,
             "rpc": f"https://eth-sepolia.g.alchemy.com/v2/{ALCHEMY_API_KEY}",
             "pool_provider": "0x012bAC54348C0E635dCAc9D5FB99f06F24136C9A",
+            "pool": "0x6Ae43d3271ff6888e7Fc43Fd7321a503ff738951",
             "AAVE_PROTOCOL_DATA_PROVIDER": "0x3e9708d80f7B3e43118013075F7e95CE3AB31F31",
             "oracle": "0x2da88497588bf89281816106C7259e31AF45a663",
             "assets": {
@@ -329,5 +335,18 @@ for net in NETWORK_CONFIG.values():
             }
     net["assets"] = normalized_assets
 
-    if "pool_provider" in net:
-        net["pool_provider"] = Web3.to_checksum_address(net["pool_provider"])
\ No newline at end of file
+    # Checksum contract addresses once here so oracle/PDP calls never re-validate them
+    for key in ("pool_provider", "pool", "AAVE_PROTOCOL_DATA_PROVIDER", "oracle"):
+        if net.get(key):
+            net[key] = Web3.to_checksum_address(net[key])
+
+# Backup RPC endpoints per network, e.g. BACKUP_RPC_BASE_SEPOLIA="https://a,https://b"
+for name, net in NETWORK_CONFIG.items():
+    backup_rpcs = os.getenv(f"BACKUP_RPC_{name.upper().replace('-', '_')}", "")
+    net["backup_rpcs"] = [url.strip() for url in backup_rpcs.split(",") if url.strip()]
+
+# Operators can pin the default network's Pool / Protocol Data Provider addresses
+if DEFAULT_NETWORK in NETWORK_CONFIG:
+    for env_var, key in (("AAVE_POOL_ADDRESS", "pool"), ("AAVE_DATA_PROVIDER_ADDRESS", "AAVE_PROTOCOL_DATA_PROVIDER")):
+        if os.getenv(env_var):
+            NETWORK_CONFIG[DEFAULT_NETWORK][key] = Web3.to_checksum_address(os.getenv(env_var))
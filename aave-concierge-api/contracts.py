@@ -1,5 +1,112 @@
+import functools
+import logging
+import random
+import socket
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import requests
+from eth_abi import encode
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from hexbytes import HexBytes
 from web3 import Web3
-from config import NETWORK_CONFIG
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted, TransactionNotFound, Web3Exception, Web3RPCError
+from config import NETWORK_CONFIG, RPC_CU_PER_SECOND
+
+logger = logging.getLogger(__name__)
+
+# Multicall3 is deployed at the same address on every chain Aave v3 runs on
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# aggregate3((address,bool,bytes)[]) returns (bool,bytes)[]; encoded directly so the
+# hot multicall path never builds a ContractFunction
+AGGREGATE3_SELECTOR = "0x82ad56cb"
+AGGREGATE3_INPUT_TYPES = ["(address,bool,bytes)[]"]
+AGGREGATE3_OUTPUT_TYPES = ["(bool,bytes)[]"]
+
+# Aave v3 Pool functions used for account reads and transaction building
+POOL_ABI = [
+    {
+        "inputs": [{"type": "address", "name": "user"}],
+        "name": "getUserAccountData",
+        "outputs": [
+            {"type": "uint256", "name": "totalCollateralBase"},
+            {"type": "uint256", "name": "totalDebtBase"},
+            {"type": "uint256", "name": "availableBorrowsBase"},
+            {"type": "uint256", "name": "currentLiquidationThreshold"},
+            {"type": "uint256", "name": "ltv"},
+            {"type": "uint256", "name": "healthFactor"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"type": "address", "name": "asset"},
+            {"type": "uint256", "name": "amount"},
+            {"type": "address", "name": "onBehalfOf"},
+            {"type": "uint16", "name": "referralCode"},
+        ],
+        "name": "supply",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"type": "address", "name": "asset"},
+            {"type": "uint256", "name": "amount"},
+            {"type": "uint256", "name": "interestRateMode"},
+            {"type": "uint16", "name": "referralCode"},
+            {"type": "address", "name": "onBehalfOf"},
+        ],
+        "name": "borrow",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"type": "address", "name": "asset"},
+            {"type": "uint256", "name": "amount"},
+            {"type": "uint256", "name": "rateMode"},
+            {"type": "address", "name": "onBehalfOf"},
+        ],
+        "name": "repay",
+        "outputs": [{"type": "uint256", "name": ""}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+# Selector and argument types of the pool functions built on every transaction request,
+# so their calldata can be encoded directly instead of through ContractFunction objects
+POOL_CALL_SIGNATURES = {
+    "supply": ("0x617ba037", ["address", "uint256", "address", "uint16"]),  # supply(address,uint256,address,uint16)
+    "borrow": ("0xa415bcad", ["address", "uint256", "uint256", "uint16", "address"]),  # borrow(address,uint256,uint256,uint16,address)
+    "repay": ("0x573ade81", ["address", "uint256", "uint256", "address"]),  # repay(address,uint256,uint256,address)
+    # supplyWithPermit(address,uint256,address,uint16,uint256,uint8,bytes32,bytes32)
+    "supplyWithPermit": ("0x02c205f0", ["address", "uint256", "address", "uint16", "uint256", "uint8", "bytes32", "bytes32"]),
+}
+
+POOL_ADDRESSES_PROVIDER_ABI = [
+    {"inputs": [], "name": "getPool", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
+]
+
+ERC20_ABI = [
+    {
+        "name": "balanceOf",
+        "inputs": [{"type": "address"}],
+        "outputs": [{"type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
 
 def get_network_config(name: str):
     """Get network configuration by name."""
@@ -10,10 +117,245 @@ def get_network_config(name: str):
     return NETWORK_CONFIG[key]
 
 
+# HTTP status codes worth retrying: rate limiting and transient gateway errors
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+RETRYABLE_ERROR_MESSAGES = ("429", "rate limit", "could not coalesce")
+RETRY_ATTEMPTS = 6
+RETRY_MAX_DELAY = 8
+
+
+def is_retryable_rpc_error(error: Exception) -> bool:
+    """Check whether an RPC failure is transient (rate limit, timeout, dropped connection)."""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in RETRYABLE_STATUS_CODES
+    if isinstance(error, Web3Exception):
+        # Providers also report rate limits as JSON-RPC errors (e.g. code 429)
+        return is_retryable_error_message(str(error))
+    return False
+
+
+def is_retryable_error_message(message: str) -> bool:
+    """Check whether a JSON-RPC error message describes a transient provider failure."""
+    message = message.lower()
+    return any(fragment in message for fragment in RETRYABLE_ERROR_MESSAGES)
+
+
+def get_retry_delay(error: Exception, attempt: int, base_delay: float) -> float:
+    """Get the wait before retrying an RPC failure, honoring a Retry-After header when present.
+
+    Without Retry-After the delay is base_delay * 2**attempt scaled by a random factor
+    in [0.5, 1.5]. Either way it is capped at RETRY_MAX_DELAY seconds.
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return min(base_delay * (2 ** attempt) * random.uniform(0.5, 1.5), RETRY_MAX_DELAY)
+
+
+def call_with_retry(fn, attempts: int = RETRY_ATTEMPTS, base_delay: float = 0.1):
+    """Run an RPC call, retrying transient failures (429s, 5xx, dropped connections) with backoff.
+
+    Non-transient errors (e.g. reverts) are raised immediately.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == attempts - 1 or not is_retryable_rpc_error(e):
+                raise
+            time.sleep(get_retry_delay(e, attempt, base_delay))
+
+
+# Web3 instances keyed by RPC URL, reused across requests
+_web3_cache = {}
+
+
+# Pool proxy address per PoolAddressesProvider. Seeded from the address book (or the
+# AAVE_POOL_ADDRESS override); anything else is resolved once via getPool() and kept.
+_pool_addresses = {net["pool_provider"]: net["pool"] for net in NETWORK_CONFIG.values() if net.get("pool")}
+
+# Connection pool sized for the threadpool route handlers plus the oracle fan-out
+RPC_POOL_CONNECTIONS = 32
+RPC_POOL_MAXSIZE = 64
+RPC_REQUEST_TIMEOUT = 10
+
+# Probe idle keep-alive sockets so load balancers don't silently drop pooled connections
+RPC_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    RPC_SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections have TCP keep-alive enabled."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = RPC_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def build_rpc_session() -> requests.Session:
+    """Create a keep-alive requests session with a connection pool sized for concurrent RPC calls."""
+    session = requests.Session()
+    adapter = KeepAliveHTTPAdapter(pool_connections=RPC_POOL_CONNECTIONS, pool_maxsize=RPC_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Approximate Alchemy compute-unit cost per JSON-RPC method, used to weight the rate limiter.
+# These are pacing weights, not billing: overestimating a rare method only delays it slightly.
+RPC_METHOD_CU_COSTS = {
+    "eth_call": 26,
+    "eth_sendRawTransaction": 250,
+    "eth_sendRawTransactionSync": 250,
+    "eth_getTransactionReceipt": 20,
+    "eth_getBlockReceipts": 500,
+    "eth_getTransactionCount": 20,
+    "eth_gasPrice": 20,
+    "eth_feeHistory": 10,
+    "eth_estimateGas": 20,
+    "eth_blockNumber": 10,
+    "eth_chainId": 0,
+}
+DEFAULT_RPC_CU_COST = 26
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until enough tokens have refilled."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = rate  # Allow at most one second of burst
+        self._tokens = rate
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float):
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared by every network: one Alchemy key's compute-unit budget covers all of them
+_rpc_rate_limiter = TokenBucket(RPC_CU_PER_SECOND) if RPC_CU_PER_SECOND > 0 else None
+
+
+def _throttle_rpc(methods):
+    """Wait for rate-limiter capacity for the given JSON-RPC methods."""
+    if _rpc_rate_limiter is not None:
+        _rpc_rate_limiter.acquire(sum(RPC_METHOD_CU_COSTS.get(method, DEFAULT_RPC_CU_COST) for method in methods))
+
+
+class RateLimitedHTTPProvider(Web3.HTTPProvider):
+    """HTTPProvider that paces requests to stay under the RPC compute-unit budget."""
+
+    def make_request(self, method, params):
+        _throttle_rpc([method])
+        return super().make_request(method, params)
+
+    def make_batch_request(self, requests):
+        _throttle_rpc([method for method, _ in requests])
+        return super().make_batch_request(requests)
+
+
+# Methods that must not be replayed on another endpoint once the request may have been sent
+NON_IDEMPOTENT_RPC_METHODS = {"eth_sendRawTransaction", "eth_sendRawTransactionSync"}
+
+
+class FailoverHTTPProvider(Web3.HTTPProvider):
+    """HTTPProvider that fails over to backup RPC endpoints on transient errors.
+
+    Requests stick to the last endpoint that answered, so a rate-limited or unreachable
+    primary is skipped until the backup itself starts failing.
+    """
+
+    def __init__(self, endpoint_uri, backup_uris, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        self._providers = [self] + [
+            Web3.HTTPProvider(
+                uri, session=build_rpc_session(), request_kwargs=kwargs.get("request_kwargs"),
+                exception_retry_configuration=None,
+            )
+            for uri in backup_uris
+        ]
+        self._active = 0
+
+    def make_request(self, method, params):
+        _throttle_rpc([method])
+        return self._with_failover(
+            lambda provider: Web3.HTTPProvider.make_request(provider, method, params), [method]
+        )
+
+    def make_batch_request(self, requests):
+        methods = [method for method, _ in requests]
+        _throttle_rpc(methods)
+        return self._with_failover(
+            lambda provider: Web3.HTTPProvider.make_batch_request(provider, requests), methods
+        )
+
+    def _with_failover(self, send, methods):
+        # A send that timed out or lost its connection may already be in the mempool, so it
+        # only moves to the next endpoint when the connection was never established
+        if NON_IDEMPOTENT_RPC_METHODS.intersection(methods):
+            can_fail_over = lambda error: isinstance(error, requests.ConnectTimeout)
+        else:
+            can_fail_over = is_retryable_rpc_error
+
+        start = self._active
+        for offset in range(len(self._providers)):
+            index = (start + offset) % len(self._providers)
+            is_last = offset == len(self._providers) - 1
+            try:
+                response = send(self._providers[index])
+            except Exception as e:
+                if is_last or not can_fail_over(e):
+                    raise
+                logger.warning("RPC endpoint %d failed, failing over: %s", index, e)
+                continue
+
+            responses = response if isinstance(response, list) else [response]
+            errors = [r["error"] for r in responses if isinstance(r, dict) and r.get("error")]
+            if not is_last and any(is_retryable_error_message(str(error)) for error in errors):
+                logger.warning("RPC endpoint %d is throttling, failing over", index)
+                continue
+
+            self._active = index
+            return response
+
+
 def init_web3(network_name: str, with_executor: bool = False):
     """Initialize Web3 connection for a given network."""
     cfg = get_network_config(network_name)
-    w3 = Web3(Web3.HTTPProvider(cfg["rpc"]))
+    w3 = _web3_cache.get(cfg["rpc"])
+    if w3 is None:
+        # Dedicated keep-alive session so TCP/TLS connections are reused between calls.
+        # web3's built-in provider retry is disabled: call_with_retry is the only retry layer,
+        # so attempts aren't multiplied and Retry-After is honored.
+        provider_kwargs = {
+            "session": build_rpc_session(),
+            "request_kwargs": {"timeout": RPC_REQUEST_TIMEOUT},
+            "exception_retry_configuration": None,
+        }
+        if cfg.get("backup_rpcs"):
+            provider = FailoverHTTPProvider(cfg["rpc"], cfg["backup_rpcs"], **provider_kwargs)
+        else:
+            provider = RateLimitedHTTPProvider(cfg["rpc"], **provider_kwargs)
+        w3 = Web3(provider)
+        _web3_cache[cfg["rpc"]] = w3
 
     if with_executor:
         from config import EXECUTOR_PRIVATE_KEY
@@ -23,92 +365,51 @@ def init_web3(network_name: str, with_executor: bool = False):
         return w3, None, cfg
 
 
-def get_pool_contract_with_abi(w3):
-    """Get the Aave pool contract instance with full ABI for transaction building."""
-    pool_abi = [
-        {
-            "inputs": [{"type": "address", "name": "user"}],
-            "name": "getUserAccountData",
-            "outputs": [
-                {"type": "uint256", "name": "totalCollateralBase"},
-                {"type": "uint256", "name": "totalDebtBase"},
-                {"type": "uint256", "name": "availableBorrowsBase"},
-                {"type": "uint256", "name": "currentLiquidationThreshold"},
-                {"type": "uint256", "name": "ltv"},
-                {"type": "uint256", "name": "healthFactor"},
-            ],
-            "stateMutability": "view",
-            "type": "function",
-        },
-        {
-            "inputs": [
-                {"type": "address", "name": "asset"},
-                {"type": "uint256", "name": "amount"},
-                {"type": "address", "name": "onBehalfOf"},
-                {"type": "uint16", "name": "referralCode"},
-            ],
-            "name": "supply",
-            "outputs": [],
-            "stateMutability": "nonpayable",
-            "type": "function",
-        },
-        {
-            "inputs": [
-                {"type": "address", "name": "asset"},
-                {"type": "uint256", "name": "amount"},
-                {"type": "uint256", "name": "interestRateMode"},
-                {"type": "uint16", "name": "referralCode"},
-                {"type": "address", "name": "onBehalfOf"},
-            ],
-            "name": "borrow",
-            "outputs": [],
-            "stateMutability": "nonpayable",
-            "type": "function",
-        },
-        {
-            "inputs": [
-                {"type": "address", "name": "asset"},
-                {"type": "uint256", "name": "amount"},
-                {"type": "uint256", "name": "rateMode"},
-                {"type": "address", "name": "onBehalfOf"},
-            ],
-            "name": "repay",
-            "outputs": [{"type": "uint256", "name": ""}],
-            "stateMutability": "nonpayable",
-            "type": "function",
-        },
-    ]
-    return pool_abi
+@functools.lru_cache(maxsize=32)
+def get_provider_contract(w3, provider_addr):
+    """Get a cached PoolAddressesProvider contract instance for a Web3 connection."""
+    return w3.eth.contract(address=provider_addr, abi=POOL_ADDRESSES_PROVIDER_ABI)
+
+
+@functools.lru_cache(maxsize=32)
+def get_pool_contract_at(w3, pool_addr):
+    """Get a cached Aave pool contract instance for a known pool address."""
+    return w3.eth.contract(address=pool_addr, abi=POOL_ABI)
 
 
 def get_pool_address(w3, provider_addr):
-    """Get the Aave pool address from the provider."""
-    provider_abi = [
-        {"inputs": [], "name": "getPool", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
-    ]
-    provider = w3.eth.contract(address=provider_addr, abi=provider_abi)
-    return provider.functions.getPool().call()
+    """Get the Aave pool address for a provider, resolving it on-chain only when not already known."""
+    pool_addr = _pool_addresses.get(provider_addr)
+    if pool_addr is None:
+        pool_addr = get_provider_contract(w3, provider_addr).functions.getPool().call()
+        logger.info("Resolved Aave pool %s for provider %s (set AAVE_POOL_ADDRESS to pin it)", pool_addr, provider_addr)
+        _pool_addresses[provider_addr] = pool_addr
+    return pool_addr
 
 
 def get_pool_contract(w3, provider_addr):
     """Get the Aave pool contract instance."""
-    pool_addr = get_pool_address(w3, provider_addr)
-    pool_abi = get_pool_contract_with_abi(w3)
-    return w3.eth.contract(address=pool_addr, abi=pool_abi)
+    return get_pool_contract_at(w3, get_pool_address(w3, provider_addr))
+
+
+def encode_pool_call(function_name: str, *args) -> str:
+    """Encode calldata for a fixed-shape pool function without going through the contract ABI."""
+    selector, arg_types = POOL_CALL_SIGNATURES[function_name]
+    return selector + encode(arg_types, args).hex()
 
 
 def build_pool_transaction(w3, provider_addr, function_name: str, *args):
     """Build transaction data for pool contract function."""
     pool_addr = get_pool_address(w3, provider_addr)
-    pool_abi = get_pool_contract_with_abi(w3)
-    pool_contract = w3.eth.contract(address=pool_addr, abi=pool_abi)
+
+    if function_name in POOL_CALL_SIGNATURES:
+        return {"to": pool_addr, "data": encode_pool_call(function_name, *args), "value": 0}
 
     # Get the function and build transaction data
-    function = getattr(pool_contract.functions, function_name)
+    function = getattr(get_pool_contract_at(w3, pool_addr).functions, function_name)
 
     # Build transaction with minimal parameters to get correct data
     tx_data = function(*args).build_transaction({
-        'from': args[-1] if function_name in ['supply', 'borrow', 'repay'] else None,  # User address is last arg
         'gas': 0,  # Will be estimated later
         'gasPrice': 0,
         'nonce': 0,
@@ -120,15 +421,222 @@ def build_pool_transaction(w3, provider_addr, function_name: str, *args):
     return tx_data
 
 
+@functools.lru_cache(maxsize=128)
 def get_token_contract(w3, token_addr):
     """Get ERC20 token contract instance for balance queries."""
-    token_abi = [
-        {
-            "name": "balanceOf",
-            "inputs": [{"type": "address"}],
-            "outputs": [{"type": "uint256"}],
-            "stateMutability": "view",
-            "type": "function"
-        }
-    ]
-    return w3.eth.contract(address=token_addr, abi=token_abi)
\ No newline at end of file
+    return w3.eth.contract(address=token_addr, abi=ERC20_ABI)
+
+
+def multicall(w3, calls):
+    """Execute (target, calldata) pairs in a single Multicall3 aggregate3 eth_call.
+
+    Returns a list with the raw return data of each call, or None for calls that reverted.
+    """
+    calldata = AGGREGATE3_SELECTOR + encode(
+        AGGREGATE3_INPUT_TYPES, [[(target, True, HexBytes(data)) for target, data in calls]]
+    ).hex()
+    return_data = call_with_retry(lambda: w3.eth.call({"to": MULTICALL3_ADDRESS, "data": calldata}))
+    (results,) = w3.codec.decode(AGGREGATE3_OUTPUT_TYPES, return_data)
+    return [data if success else None for success, data in results]
+
+
+def execute_call(w3, call):
+    """Execute a single (target, calldata, decode_fn) read built by a build_*_call helper."""
+    target, calldata, decode = call
+    return decode(call_with_retry(lambda: w3.eth.call({"to": target, "data": calldata})))
+
+
+def execute_multicall(w3, calls):
+    """Execute several (target, calldata, decode_fn) reads in one Multicall3 call.
+
+    Each result is passed through its decode_fn; reverted calls decode from empty bytes.
+    """
+    return_data = multicall(w3, [(target, calldata) for target, calldata, _ in calls])
+    return [decode(data or b"") for (_, _, decode), data in zip(calls, return_data)]
+
+
+# EIP-7966 error code returned when the transaction was accepted but not included before the timeout
+SEND_RAW_TRANSACTION_SYNC_TIMEOUT_CODE = 4
+# JSON-RPC "method not found" (-32601) and EIP-1474 "method not supported" (-32004) codes
+METHOD_NOT_FOUND_CODES = {-32601, -32004}
+# Alchemy answers unsupported methods with a generic -32600 invalid request; only treat
+# that code as "unsupported" when the message says so
+INVALID_REQUEST_CODE = -32600
+METHOD_NOT_SUPPORTED_MESSAGES = ("not supported", "unsupported", "does not exist", "not available", "method not found")
+
+# Receipt waiting for nodes without eth_sendRawTransactionSync. The block number is polled
+# every RECEIPT_POLL_LATENCY seconds; receipts are only requested when a new block lands.
+RECEIPT_TIMEOUT = 120
+RECEIPT_POLL_LATENCY = 0.5
+
+# Web3 connections whose node rejected eth_sendRawTransactionSync as an unknown method
+_sync_send_unsupported = set()
+
+# Mined receipts keyed by (w3, tx_hash), so repeated GET /tx polls stop hitting the node
+# once a transaction is included. Oldest entries are evicted past RECEIPT_CACHE_SIZE.
+RECEIPT_CACHE_SIZE = 1024
+_receipt_cache = {}
+_receipt_cache_lock = threading.Lock()
+
+# Pending count at which one eth_getBlockReceipts per block costs fewer compute units than
+# one eth_getTransactionReceipt per pending transaction per block
+BLOCK_RECEIPTS_MIN_PENDING = RPC_METHOD_CU_COSTS["eth_getBlockReceipts"] // RPC_METHOD_CU_COSTS["eth_getTransactionReceipt"]
+
+# Web3 connections whose node rejected eth_getBlockReceipts as an unknown method
+_block_receipts_unsupported = set()
+
+
+def is_method_unsupported_error(error: Web3RPCError) -> bool:
+    """Whether an RPC error means the node doesn't implement the requested method."""
+    error = (getattr(error, "rpc_response", None) or {}).get("error") or {}
+    if error.get("code") in METHOD_NOT_FOUND_CODES:
+        return True
+    message = str(error.get("message", "")).lower()
+    return error.get("code") == INVALID_REQUEST_CODE and any(m in message for m in METHOD_NOT_SUPPORTED_MESSAGES)
+
+
+def _format_sync_receipt(receipt) -> AttributeDict:
+    """Format the raw receipt returned by eth_sendRawTransactionSync with web3's own receipt
+    formatter, so it has the same shape as one from eth_getTransactionReceipt."""
+    return AttributeDict.recursive(receipt_formatter(receipt))
+
+
+def _remember_receipt(w3, tx_hash, receipt):
+    """Store a mined receipt in the bounded receipt cache."""
+    with _receipt_cache_lock:
+        _receipt_cache[(w3, HexBytes(tx_hash))] = receipt
+        while len(_receipt_cache) > RECEIPT_CACHE_SIZE:
+            del _receipt_cache[next(iter(_receipt_cache))]
+    return receipt
+
+
+def get_transaction_receipt(w3, tx_hash):
+    """Return the receipt for tx_hash, or None while the transaction is still pending."""
+    receipt = _receipt_cache.get((w3, HexBytes(tx_hash)))
+    if receipt is not None:
+        return receipt
+    try:
+        receipt = w3.eth.get_transaction_receipt(tx_hash)
+    except TransactionNotFound:
+        return None
+    return _remember_receipt(w3, tx_hash, receipt)
+
+
+class ReceiptWatcher:
+    """Resolves receipt waits for one web3 connection from a single block-driven loop.
+
+    Rather than every waiter polling eth_getTransactionReceipt, one thread polls eth_blockNumber
+    and only looks for receipts when a new block arrives. Once enough transactions are pending,
+    each block's receipts are fetched in one eth_getBlockReceipts call instead.
+    """
+
+    def __init__(self, w3):
+        self.w3 = w3
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def wait(self, tx_hash, timeout: float = RECEIPT_TIMEOUT):
+        """Block until tx_hash is mined and return its receipt."""
+        tx_hash = HexBytes(tx_hash)
+        with self._lock:
+            future = self._pending.get(tx_hash)
+            if future is None:
+                future = self._pending[tx_hash] = Future()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        try:
+            # Covers a transaction mined in a block the loop scanned before it was registered
+            receipt = get_transaction_receipt(self.w3, tx_hash)
+            if receipt is not None:
+                self._resolve(tx_hash, receipt)
+            return future.result(timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                if self._pending.get(tx_hash) is future:
+                    del self._pending[tx_hash]
+            raise TimeExhausted(f"Transaction {tx_hash.to_0x_hex()} is not in the chain after {timeout} seconds")
+
+    def _resolve(self, tx_hash, receipt):
+        with self._lock:
+            future = self._pending.pop(tx_hash, None)
+        if future is not None:
+            future.set_result(_remember_receipt(self.w3, tx_hash, receipt))
+
+    def _run(self):
+        last_block = None
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                pending = list(self._pending)
+            try:
+                head = self.w3.eth.block_number
+                if last_block is None or head > last_block:
+                    self._check_block_range(pending, last_block, head)
+                    last_block = head
+            except Exception as e:
+                logger.warning("Receipt watcher failed to check block: %s", e)
+            time.sleep(RECEIPT_POLL_LATENCY)
+
+    def _check_block_range(self, pending, last_block, head):
+        if (last_block is not None and len(pending) >= BLOCK_RECEIPTS_MIN_PENDING
+                and self.w3 not in _block_receipts_unsupported):
+            try:
+                for number in range(last_block + 1, head + 1):
+                    for receipt in self.w3.eth.get_block_receipts(number):
+                        self._resolve(HexBytes(receipt["transactionHash"]), receipt)
+                return
+            except Web3RPCError as e:
+                if not is_method_unsupported_error(e):
+                    raise
+                _block_receipts_unsupported.add(self.w3)
+
+        for tx_hash in pending:
+            receipt = get_transaction_receipt(self.w3, tx_hash)
+            if receipt is not None:
+                self._resolve(tx_hash, receipt)
+
+
+@functools.lru_cache(maxsize=None)
+def get_receipt_watcher(w3) -> ReceiptWatcher:
+    """Get the shared receipt watcher for a web3 connection."""
+    return ReceiptWatcher(w3)
+
+
+def wait_for_receipt(w3, tx_hash):
+    """Wait for a transaction receipt, checking once per new block through the shared watcher."""
+    return get_receipt_watcher(w3).wait(tx_hash)
+
+
+def send_raw_transaction_sync(w3, raw_transaction, wait: bool = True):
+    """Submit a signed transaction and return (tx_hash, receipt).
+
+    Uses eth_sendRawTransactionSync (EIP-7966) so submission and receipt take one round-trip,
+    falling back to send_raw_transaction + wait_for_transaction_receipt on nodes without it.
+    With wait=False the transaction is only submitted and the receipt is None; it can be
+    fetched later with get_transaction_receipt.
+    """
+    raw_transaction = HexBytes(raw_transaction)
+    if not wait:
+        return w3.eth.send_raw_transaction(raw_transaction), None
+    if w3 not in _sync_send_unsupported:
+        try:
+            receipt = _format_sync_receipt(
+                w3.manager.request_blocking("eth_sendRawTransactionSync", [raw_transaction.to_0x_hex()])
+            )
+            return receipt["transactionHash"], _remember_receipt(w3, receipt["transactionHash"], receipt)
+        except Web3RPCError as e:
+            error = (getattr(e, "rpc_response", None) or {}).get("error") or {}
+            if error.get("code") == SEND_RAW_TRANSACTION_SYNC_TIMEOUT_CODE:
+                # Already submitted - keep waiting for inclusion instead of resending
+                tx_hash = Web3.keccak(raw_transaction)
+                return tx_hash, wait_for_receipt(w3, tx_hash)
+            if not is_method_unsupported_error(e):
+                raise
+            _sync_send_unsupported.add(w3)
+
+    tx_hash = w3.eth.send_raw_transaction(raw_transaction)
+    return tx_hash, wait_for_receipt(w3, tx_hash)
@@ -1,5 +1,6 @@
 import os
 import sys
+import logging
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse, HTMLResponse
@@ -8,9 +9,13 @@ from fastapi.middleware.cors import CORSMiddleware
 # Add current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Debug output from the oracle/utils modules is only formatted when LOG_LEVEL=DEBUG
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+
 # Import our modular components
 from api.routes import router as api_router
 from api.manifest import router as manifest_router
+from utils import flush_logs, track_request_logs
 
 # ============================================================
 # FASTAPI APP
@@ -71,8 +76,13 @@ if os.path.exists(static_dir):
 @app.middleware("http")
 async def add_mcp_headers(request: Request, call_next):
     """Add MCP-specific headers for AI agent discovery."""
+    pending_logs = track_request_logs()
     response = await call_next(request)
 
+    # Deliver this request's Hedera audit logs before the instance can be frozen;
+    # requests that logged nothing (health checks, static files, preflights) return at once
+    await flush_logs(pending_logs)
+
     # Add MCP discovery headers
     response.headers["X-MCP-Version"] = "1.0"
     response.headers["X-MCP-Endpoint"] = "/mcp-manifest"
@@ -1,19 +1,43 @@
-from pydantic import BaseModel
+import time
+from decimal import Decimal
+from pydantic import BaseModel, Field, field_validator
 from config import DEFAULT_NETWORK
 from typing import Optional, Literal
 
+BYTES32_PATTERN = r"^0x[0-9a-fA-F]{64}$"
+
+
+class PermitSignature(BaseModel):
+    """EIP-2612 permit signed by the user for the pool as spender."""
+    deadline: int
+    v: int = Field(ge=0, le=255)
+    r: str = Field(pattern=BYTES32_PATTERN)  # 0x-prefixed bytes32
+    s: str = Field(pattern=BYTES32_PATTERN)  # 0x-prefixed bytes32
+
+    @field_validator("deadline")
+    @classmethod
+    def deadline_not_passed(cls, deadline: int) -> int:
+        # An expired permit makes supplyWithPermit revert on-chain, so reject it up front
+        if deadline < time.time():
+            raise ValueError("permit deadline has already passed")
+        return deadline
+
+
 class AaveRequest(BaseModel):
     """Base request model for Aave operations."""
-    amount: float
+    # JSON numbers arrive as floats and pydantic turns them into Decimal via their shortest
+    # repr (1.1 -> Decimal("1.1")), so wei scaling is exact; send a string for >15 significant digits
+    amount: Decimal
     token: str
     network: str = DEFAULT_NETWORK
     user_address: str
     action: Optional[Literal["supply", "borrow"]] = None  # New optional action parameter
+    permit: Optional[PermitSignature] = None  # Supply via supplyWithPermit, skipping the approval tx
 
 
 class TransactionRequest(BaseModel):
     """Request model for transaction building."""
-    amount: float
+    amount: Decimal
     token: str
     network: str = DEFAULT_NETWORK
     user_address: str
@@ -34,6 +58,7 @@ class ExecuteTransactionRequest(BaseModel):
     """Request model for executing a signed transaction."""
     signed_transaction: str
     network: str = DEFAULT_NETWORK
+    wait_for_receipt: bool = True  # False returns the hash as soon as the node accepts the tx
 
 
 class SupplyResponse(BaseModel):
@@ -83,6 +108,22 @@ class HealthResponse(BaseModel):
     safe_to_borrow: bool
 
 
+# Users per /health/batch request; keeps the single aggregate3 eth_call under node gas and size limits
+MAX_HEALTH_BATCH_SIZE = 100
+
+
+class HealthBatchRequest(BaseModel):
+    """Request model for health factor queries across several users."""
+    user_addresses: list[str] = Field(min_length=1, max_length=MAX_HEALTH_BATCH_SIZE)
+    network: str = DEFAULT_NETWORK
+
+
+class HealthBatchResponse(BaseModel):
+    """Response model with health factor status per user address (None when the read failed)."""
+    network: str
+    users: dict[str, HealthResponse | None]
+
+
 class SimulateResponse(BaseModel):
     """Response model for simulation operations."""
     action: str
@@ -3,11 +3,266 @@ Aave Oracle Integration Module
 Provides real-time price feeds and asset data from Aave's oracle contracts
 """
 
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
 from web3 import Web3
-from contracts import init_web3
+from contracts import init_web3, multicall, call_with_retry
+
+logger = logging.getLogger(__name__)
+
+
+# AaveOracle ABI for getting asset prices
+ORACLE_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "asset", "type": "address"}],
+        "name": "getAssetPrice",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [{"name": "asset", "type": "address"}],
+        "name": "getSourceOfAsset",
+        "outputs": [{"name": "", "type": "address"}],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+# AaveProtocolDataProvider ABI (simplified)
+PDP_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "asset", "type": "address"}],
+        "name": "getReserveConfigurationData",
+        "outputs": [
+            {"name": "decimals", "type": "uint256"},
+            {"name": "ltv", "type": "uint256"},
+            {"name": "liquidationThreshold", "type": "uint256"},
+            {"name": "liquidationBonus", "type": "uint256"},
+            {"name": "reserveFactor", "type": "uint256"},
+            {"name": "usageAsCollateralEnabled", "type": "bool"},
+            {"name": "borrowingEnabled", "type": "bool"},
+            {"name": "stableBorrowRateEnabled", "type": "bool"},
+            {"name": "isActive", "type": "bool"},
+            {"name": "isFrozen", "type": "bool"}
+        ],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "getAllATokens",
+        "outputs": [{"name": "", "type": "address[]"}],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+# Output types of getReserveConfigurationData and Chainlink's latestRoundData
+# (roundId, answer, startedAt, updatedAt, answeredInRound), used to decode raw call results
+RESERVE_CONFIGURATION_TYPES = ["uint256"] * 5 + ["bool"] * 5
+ROUND_DATA_TYPES = ["uint80", "int256", "uint256", "uint256", "uint80"]
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# 4-byte selectors for the fixed call shapes used on the hot path, so calldata can be
+# built and results decoded without going through ContractFunction objects
+GET_ASSET_PRICE_SELECTOR = "0xb3596f07"  # getAssetPrice(address)
+GET_RESERVE_CONFIGURATION_DATA_SELECTOR = "0x3e150141"  # getReserveConfigurationData(address)
+LATEST_ROUND_DATA_SELECTOR = "0xfeaf968c"  # latestRoundData()
+
+# AaveOracle quotes USD prices with 8 decimals. Kept as an int so that
+# price_raw / ORACLE_PRICE_SCALE is a correctly rounded int/int division
+# instead of first converting a (possibly > 2**53) uint256 to float.
+ORACLE_PRICE_SCALE = 10**8
+
+# Maximum accepted age (seconds) of a Chainlink price. Stablecoin feeds only
+# update on a 24h heartbeat; everything else defaults to Chainlink's 1h.
+DEFAULT_PRICE_HEARTBEAT = 3600
+PRICE_HEARTBEATS = {
+    "USDC": 86400,
+    "USDCe": 86400,
+    "USDCn": 86400,
+    "USDT": 86400,
+    "USDT0": 86400,
+}
+
+# Read-only fallback values used when the oracle / Protocol Data Provider is unavailable
+FALLBACK_PRICES = MappingProxyType({
+    "USDC": 1.0,
+    "USDT": 1.0,
+    "DAI": 1.0,
+    "WETH": 2000.0,
+    "WBTC": 50000.0,
+    "LINK": 15.0,
+    "cbETH": 3000.0,
+})
+
+FALLBACK_LIQUIDATION_THRESHOLDS = MappingProxyType({
+    "USDC": 0.90,
+    "USDT": 0.90,
+    "DAI": 0.90,
+    "WETH": 0.85,
+    "WBTC": 0.85,
+    "LINK": 0.80,
+    "cbETH": 0.85,
+})
+
+# Shared worker pool used to overlap per-asset RPC calls when they cannot be aggregated
+_rpc_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="oracle-rpc")
+
+# Time-to-live (seconds) for cached oracle prices and reserve configurations.
+# Reserve configuration only changes through governance, so it can be cached much longer.
+PRICE_CACHE_TTL = 10
+CONFIG_CACHE_TTL = 300
+SOURCE_CACHE_TTL = 3600
+
+# (timestamp, value) entries keyed by (oracle_address, token_address) / (pdp_address, token_address)
+_price_cache = {}
+_config_cache = {}
+_source_cache = {}
+_cache_lock = threading.RLock()
+
+
+def _get_cached(cache: dict, key: tuple, ttl: int):
+    """Return a cached value if it is younger than ttl seconds, else None."""
+    with _cache_lock:
+        entry = cache.get(key)
+    if entry and time.time() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+
+def _set_cached(cache: dict, key: tuple, value):
+    """Store a value in one of the oracle caches."""
+    with _cache_lock:
+        cache[key] = (time.time(), value)
+
+
+@functools.lru_cache(maxsize=32)
+def get_oracle_contract(w3: Web3, oracle_address: str):
+    """Get a cached AaveOracle contract instance for a Web3 connection."""
+    return w3.eth.contract(address=oracle_address, abi=ORACLE_ABI)
+
+
+@functools.lru_cache(maxsize=32)
+def get_pdp_contract(w3: Web3, pdp_address: str):
+    """Get a cached Protocol Data Provider contract instance for a Web3 connection."""
+    return w3.eth.contract(address=pdp_address, abi=PDP_ABI)
+
+
+def encode_address_call(selector: str, address: str) -> str:
+    """Build calldata for a function taking a single address argument."""
+    return f"{selector}{int(address, 16):064x}"
+
+
+def get_price_heartbeat(token_symbol: str) -> int:
+    """Maximum accepted price age in seconds for a token."""
+    return PRICE_HEARTBEATS.get(token_symbol, DEFAULT_PRICE_HEARTBEAT)
+
+
+def get_price_sources(w3: Web3, assets: list) -> list:
+    """
+    Resolve the Chainlink source behind each AaveOracle price
+
+    Sources rarely change, so they are cached for SOURCE_CACHE_TTL and missing
+    ones are resolved with a single Multicall3 call.
+
+    Args:
+        w3: Web3 instance
+        assets: List of (token_address, oracle_address) pairs
+
+    Returns:
+        List of source addresses in the same order as assets (ZERO_ADDRESS if unknown)
+    """
+    sources = {}
+    missing = []
+
+    for token_address, oracle_address in set(assets):
+        source = _get_cached(_source_cache, (oracle_address, token_address), SOURCE_CACHE_TTL)
+        if source is None:
+            missing.append((token_address, oracle_address))
+        else:
+            sources[(token_address, oracle_address)] = source
+
+    if missing:
+        calls = [
+            (oracle_address, get_oracle_contract(w3, oracle_address).encode_abi("getSourceOfAsset", args=[token_address]))
+            for token_address, oracle_address in missing
+        ]
+        for (token_address, oracle_address), return_data in zip(missing, multicall(w3, calls)):
+            source = Web3.to_checksum_address(w3.codec.decode(["address"], return_data)[0]) if return_data else ZERO_ADDRESS
+            _set_cached(_source_cache, (oracle_address, token_address), source)
+            sources[(token_address, oracle_address)] = source
+
+    return [sources[asset] for asset in assets]
+
+
+def is_price_fresh(round_data, max_age: int, token_address: str) -> bool:
+    """
+    Check Chainlink latestRoundData for a stale or incomplete round
+
+    Args:
+        round_data: (roundId, answer, startedAt, updatedAt, answeredInRound)
+        max_age: Maximum accepted age of the answer in seconds
+        token_address: The underlying token contract address (for logging)
+
+    Returns:
+        True if the round is complete and updated within max_age seconds
+    """
+    round_id, _, _, updated_at, answered_in_round = round_data
+
+    if answered_in_round < round_id:
+        logger.warning("Incomplete oracle round for %s: answeredInRound=%s < roundId=%s", token_address, answered_in_round, round_id)
+        return False
+
+    age = time.time() - updated_at
+    if age > max_age:
+        logger.warning("Stale oracle price for %s: updated %.0fs ago (heartbeat %ss)", token_address, age, max_age)
+        return False
+
+    return True
+
+
+def check_price_freshness(w3: Web3, token_address: str, oracle_address: str, max_age: int) -> bool:
+    """
+    Check that the Chainlink source behind an AaveOracle price is fresh
 
+    Sources that can't be resolved or don't expose latestRoundData are not rejected.
 
-def get_token_price_oracle(w3: Web3, token_address: str, oracle_address: str) -> float:
+    Returns:
+        False only when the source reports a stale or incomplete round
+    """
+    try:
+        source = get_price_sources(w3, [(token_address, oracle_address)])[0]
+        if source == ZERO_ADDRESS:
+            return True
+        round_data = w3.codec.decode(
+            ROUND_DATA_TYPES,
+            call_with_retry(lambda: w3.eth.call({"to": source, "data": LATEST_ROUND_DATA_SELECTOR}))
+        )
+    except Exception as e:
+        logger.debug("Could not read price source for %s, skipping freshness check: %s", token_address, e)
+        return True
+
+    return is_price_fresh(round_data, max_age, token_address)
+
+
+def get_token_price_oracle(w3: Web3, token_address: str, oracle_address: str,
+                           max_age: int = DEFAULT_PRICE_HEARTBEAT) -> float:
     """
     Get real-time token price from Aave's price oracle
 
@@ -15,57 +270,59 @@ def get_token_price_oracle(w3: Web3, token_address: str, oracle_address: str) ->
         w3: Web3 instance
         token_address: The underlying token contract address
         oracle_address: The Aave oracle contract address
+        max_age: Maximum accepted age (seconds) of the underlying Chainlink price
 
     Returns:
-        Token price in USD (human-readable)
+        Token price in USD (human-readable), or 0.0 if unavailable or stale
     """
-    try:
-        # AaveOracle ABI for getting asset prices
-        oracle_abi = [
-            {
-                "constant": True,
-                "inputs": [{"name": "asset", "type": "address"}],
-                "name": "getAssetPrice",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "constant": True,
-                "inputs": [{"name": "asset", "type": "address"}],
-                "name": "getSourceOfAsset",
-                "outputs": [{"name": "", "type": "address"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-
-        oracle_contract = w3.eth.contract(address=oracle_address, abi=oracle_abi)
+    cached_price = _get_cached(_price_cache, (oracle_address, token_address), PRICE_CACHE_TTL)
+    if cached_price is not None:
+        return cached_price
 
+    try:
         # Get price from oracle (returns price in base currency, usually 1e8 precision)
-        price_raw = oracle_contract.functions.getAssetPrice(token_address).call()
+        price_calldata = encode_address_call(GET_ASSET_PRICE_SELECTOR, token_address)
+        price_raw = int.from_bytes(
+            call_with_retry(lambda: w3.eth.call({"to": oracle_address, "data": price_calldata})), "big"
+        )
 
         # Debug: Log the raw price and oracle info
-        print(f"[DEBUG] Oracle {oracle_address} price for {token_address}: {price_raw}")
+        logger.debug("Oracle %s price for %s: %s", oracle_address, token_address, price_raw)
 
-        # Aave prices are typically in base currency with 8 decimals for USD
-        # So we divide by 1e8 to get the USD price
-        price_usd = price_raw / 1e8
-
-        # Additional validation: price should be reasonable
-        if price_usd <= 0 or price_usd > 1000000:  # Sanity check: price between $0 and $1M
-            print(f"[WARN] Unreasonable price detected: ${price_usd} for {token_address}")
+        price = parse_oracle_price(price_raw, token_address)
+        if price > 0 and not check_price_freshness(w3, token_address, oracle_address, max_age):
             return 0.0
-
-        print(f"[DEBUG] Converted price: ${price_usd:.6f} for {token_address}")
-        return float(price_usd)
+        if price > 0:
+            _set_cached(_price_cache, (oracle_address, token_address), price)
+        return price
 
     except Exception as e:
-        print(f"[WARN] Failed to get oracle price for {token_address}: {e}")
+        logger.warning("Failed to get oracle price for %s: %s", token_address, e)
+        return 0.0
+
+
+def parse_oracle_price(price_raw: int, token_address: str) -> float:
+    """
+    Convert a raw AaveOracle price into a USD price
+
+    Args:
+        price_raw: Value returned by getAssetPrice (base currency, 8 decimals)
+        token_address: The underlying token contract address (for logging)
+
+    Returns:
+        Token price in USD, or 0.0 if the price fails the sanity check
+    """
+    # Aave prices are typically in base currency with 8 decimals for USD
+    price_usd = price_raw / ORACLE_PRICE_SCALE
+
+    # Additional validation: price should be reasonable
+    if price_usd <= 0 or price_usd > 1000000:  # Sanity check: price between $0 and $1M
+        logger.warning("Unreasonable price detected: $%s for %s", price_usd, token_address)
         return 0.0
 
+    logger.debug("Converted price: $%.6f for %s", price_usd, token_address)
+    return float(price_usd)
+
 
 def get_protocol_data_provider(w3: Web3, pdp_address: str) -> dict:
     """
@@ -79,48 +336,15 @@ def get_protocol_data_provider(w3: Web3, pdp_address: str) -> dict:
         Dictionary containing real-time asset configuration data
     """
     try:
-        # AaveProtocolDataProvider ABI (simplified)
-        pdp_abi = [
-            {
-                "constant": True,
-                "inputs": [{"name": "asset", "type": "address"}],
-                "name": "getReserveConfigurationData",
-                "outputs": [
-                    {"name": "decimals", "type": "uint256"},
-                    {"name": "ltv", "type": "uint256"},
-                    {"name": "liquidationThreshold", "type": "uint256"},
-                    {"name": "liquidationBonus", "type": "uint256"},
-                    {"name": "reserveFactor", "type": "uint256"},
-                    {"name": "usageAsCollateralEnabled", "type": "bool"},
-                    {"name": "borrowingEnabled", "type": "bool"},
-                    {"name": "stableBorrowRateEnabled", "type": "bool"},
-                    {"name": "isActive", "type": "bool"},
-                    {"name": "isFrozen", "type": "bool"}
-                ],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "constant": True,
-                "inputs": [],
-                "name": "getAllATokens",
-                "outputs": [{"name": "", "type": "address[]"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-
-        pdp_contract = w3.eth.contract(address=pdp_address, abi=pdp_abi)
+        pdp_contract = get_pdp_contract(w3, pdp_address)
 
         return {
             "contract": pdp_contract,
-            "abi": pdp_abi
+            "abi": PDP_ABI
         }
 
     except Exception as e:
-        print(f"[WARN] Failed to initialize Protocol Data Provider: {e}")
+        logger.warning("Failed to initialize Protocol Data Provider: %s", e)
         return None
 
 
@@ -136,33 +360,270 @@ def get_asset_real_time_data(w3: Web3, pdp_contract, token_address: str) -> dict
     Returns:
         Dictionary with asset configuration data
     """
+    cached_config = _get_cached(_config_cache, (pdp_contract.address, token_address), CONFIG_CACHE_TTL)
+    if cached_config is not None:
+        return cached_config
+
     try:
-        config_data = pdp_contract.functions.getReserveConfigurationData(token_address).call()
+        config_calldata = encode_address_call(GET_RESERVE_CONFIGURATION_DATA_SELECTOR, token_address)
+        config_data = w3.codec.decode(
+            RESERVE_CONFIGURATION_TYPES,
+            call_with_retry(lambda: w3.eth.call({"to": pdp_contract.address, "data": config_calldata}))
+        )
+        asset_config = parse_reserve_configuration(config_data, token_address)
+        _set_cached(_config_cache, (pdp_contract.address, token_address), asset_config)
+        return asset_config
+
+    except Exception as e:
+        logger.warning("Failed to get asset configuration for %s: %s", token_address, e)
+        return None
 
-        # Debug: Print the raw config data to understand the format
-        print(f"[DEBUG] Raw config data for {token_address}: {config_data}")
 
-        ltv = config_data[1] / 10000  # Convert from basis points to decimal (e.g., 7500 -> 0.75)
-        liquidation_threshold = config_data[2] / 10000  # Convert from basis points
+def parse_reserve_configuration(config_data, token_address: str) -> dict:
+    """
+    Convert raw getReserveConfigurationData output into asset configuration data
 
-        print(f"[DEBUG] Processed data for {token_address}: LTV={ltv:.2%}, LT={liquidation_threshold:.2%}")
+    Args:
+        config_data: 10-tuple returned by getReserveConfigurationData
+        token_address: The token contract address (for logging)
 
-        return {
-            "decimals": config_data[0],
-            "ltv": ltv,
-            "liquidation_threshold": liquidation_threshold,
-            "liquidation_bonus": config_data[3] / 10000,
-            "reserve_factor": config_data[4] / 10000,
-            "usage_as_collateral": config_data[5],
-            "borrowing_enabled": config_data[6],
-            "stable_borrow_enabled": config_data[7],
-            "is_active": config_data[8],
-            "is_frozen": config_data[9]
-        }
+    Returns:
+        Dictionary with asset configuration data
+    """
+    # Basis point fields are converted to decimals (e.g., 7500 -> 0.75)
+    asset_config = {
+        "decimals": config_data[0],
+        "ltv": config_data[1] / 10000,
+        "liquidation_threshold": config_data[2] / 10000,
+        "liquidation_bonus": config_data[3] / 10000,
+        "reserve_factor": config_data[4] / 10000,
+        "usage_as_collateral": config_data[5],
+        "borrowing_enabled": config_data[6],
+        "stable_borrow_enabled": config_data[7],
+        "is_active": config_data[8],
+        "is_frozen": config_data[9]
+    }
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Raw config data for %s: %s", token_address, config_data)
+        logger.debug(
+            "Processed data for %s: LTV=%.2f%%, LT=%.2f%%",
+            token_address, asset_config["ltv"] * 100, asset_config["liquidation_threshold"] * 100
+        )
+
+    return asset_config
+
+
+def fetch_asset_data_multicall(w3: Web3, pdp_contract, assets: list, max_ages: list = None) -> list:
+    """
+    Fetch oracle prices and reserve configurations for many assets in one Multicall3 call
+
+    The latestRoundData of each price source is read in the same call, and prices
+    whose source round is stale or incomplete are rejected.
+
+    Args:
+        w3: Web3 instance
+        pdp_contract: Protocol Data Provider contract instance
+        assets: List of (token_address, oracle_address) pairs
+        max_ages: Maximum accepted price age in seconds per asset (defaults to DEFAULT_PRICE_HEARTBEAT)
+
+    Returns:
+        List of (price, asset_config) pairs in the same order as assets
+    """
+    if max_ages is None:
+        max_ages = [DEFAULT_PRICE_HEARTBEAT] * len(assets)
+
+    sources = get_price_sources(w3, assets)
+    calls = []
+    round_data_index = {}
+
+    for token_address, oracle_address in assets:
+        calls.append((oracle_address, encode_address_call(GET_ASSET_PRICE_SELECTOR, token_address)))
+        calls.append((pdp_contract.address, encode_address_call(GET_RESERVE_CONFIGURATION_DATA_SELECTOR, token_address)))
+
+    for i, source in enumerate(sources):
+        if source != ZERO_ADDRESS:
+            round_data_index[i] = len(calls)
+            calls.append((source, LATEST_ROUND_DATA_SELECTOR))
+
+    return_data = multicall(w3, calls)
+
+    results = []
+    for i, (token_address, _) in enumerate(assets):
+        price_data = return_data[2 * i]
+        config_data = return_data[2 * i + 1]
+        round_data = return_data[round_data_index[i]] if i in round_data_index else None
+
+        if price_data:
+            price = parse_oracle_price(int.from_bytes(price_data, "big"), token_address)
+            if price > 0 and round_data and not is_price_fresh(
+                w3.codec.decode(ROUND_DATA_TYPES, round_data), max_ages[i], token_address
+            ):
+                price = 0.0
+        else:
+            logger.warning("Failed to get oracle price for %s: call reverted", token_address)
+            price = 0.0
+
+        if config_data:
+            asset_config = parse_reserve_configuration(
+                w3.codec.decode(RESERVE_CONFIGURATION_TYPES, config_data), token_address
+            )
+        else:
+            logger.warning("Failed to get asset configuration for %s: call reverted", token_address)
+            asset_config = None
+
+        results.append((price, asset_config))
+
+    return results
 
-    except Exception as e:
-        print(f"[WARN] Failed to get asset configuration for {token_address}: {e}")
-        return None
+
+def fetch_asset_data_batch(w3: Web3, pdp_contract, assets: list, max_ages: list = None) -> list:
+    """
+    Fetch oracle prices and reserve configurations for many assets in JSON-RPC batches
+
+    The first batch also resolves each price source; a second batch reads their
+    latestRoundData so stale rounds are rejected here as on the multicall path.
+    Prices whose freshness cannot be checked fall back to 0.0.
+
+    Args:
+        w3: Web3 instance
+        pdp_contract: Protocol Data Provider contract instance
+        assets: List of (token_address, oracle_address) pairs
+        max_ages: Maximum accepted price age in seconds per asset (defaults to DEFAULT_PRICE_HEARTBEAT)
+
+    Returns:
+        List of (price, asset_config) pairs in the same order as assets
+    """
+    if max_ages is None:
+        max_ages = [DEFAULT_PRICE_HEARTBEAT] * len(assets)
+
+    with w3.batch_requests() as batch:
+        for token_address, oracle_address in assets:
+            oracle_contract = get_oracle_contract(w3, oracle_address)
+            batch.add(oracle_contract.functions.getAssetPrice(token_address))
+            batch.add(pdp_contract.functions.getReserveConfigurationData(token_address))
+            batch.add(oracle_contract.functions.getSourceOfAsset(token_address))
+
+        responses = batch.execute()
+
+    sources = []
+    for i, (token_address, oracle_address) in enumerate(assets):
+        source = Web3.to_checksum_address(responses[3 * i + 2])
+        _set_cached(_source_cache, (oracle_address, token_address), source)
+        sources.append(source)
+
+    round_data = {}
+    checked = [i for i, source in enumerate(sources) if source != ZERO_ADDRESS]
+    if checked:
+        try:
+            with w3.batch_requests() as batch:
+                for i in checked:
+                    batch.add(w3.eth.call({"to": sources[i], "data": LATEST_ROUND_DATA_SELECTOR}))
+                round_responses = batch.execute()
+            for i, data in zip(checked, round_responses):
+                round_data[i] = w3.codec.decode(ROUND_DATA_TYPES, data)
+        except Exception as e:
+            logger.warning("Could not read price sources, rejecting unchecked prices: %s", e)
+
+    results = []
+    for i, (token_address, _) in enumerate(assets):
+        price = parse_oracle_price(responses[3 * i], token_address)
+        if price > 0 and i in checked and (
+            i not in round_data or not is_price_fresh(round_data[i], max_ages[i], token_address)
+        ):
+            price = 0.0
+        asset_config = parse_reserve_configuration(responses[3 * i + 1], token_address)
+        results.append((price, asset_config))
+
+    return results
+
+
+def fetch_asset_data_concurrent(w3: Web3, pdp_contract, assets: list, max_ages: list = None) -> list:
+    """
+    Fetch oracle prices and reserve configurations with concurrent per-asset calls
+
+    Args:
+        w3: Web3 instance
+        pdp_contract: Protocol Data Provider contract instance
+        assets: List of (token_address, oracle_address) pairs
+        max_ages: Maximum accepted price age in seconds per asset (defaults to DEFAULT_PRICE_HEARTBEAT)
+
+    Returns:
+        List of (price, asset_config) pairs in the same order as assets
+    """
+    if max_ages is None:
+        max_ages = [DEFAULT_PRICE_HEARTBEAT] * len(assets)
+
+    price_futures = [
+        _rpc_executor.submit(get_token_price_oracle, w3, token_address, oracle_address, max_age)
+        for (token_address, oracle_address), max_age in zip(assets, max_ages)
+    ]
+    config_futures = [
+        _rpc_executor.submit(get_asset_real_time_data, w3, pdp_contract, token_address)
+        for token_address, _ in assets
+    ]
+    return [
+        (price_future.result(), config_future.result())
+        for price_future, config_future in zip(price_futures, config_futures)
+    ]
+
+
+def fetch_asset_data(w3: Web3, network: str, pdp_contract, assets: list, max_ages: list = None) -> list:
+    """
+    Fetch oracle prices and reserve configurations, serving fresh values from cache
+
+    Assets that are not fully cached are fetched with a single Multicall3 call,
+    falling back to a JSON-RPC batch and then to concurrent per-asset calls.
+
+    Args:
+        w3: Web3 instance
+        network: Network name (for logging)
+        pdp_contract: Protocol Data Provider contract instance
+        assets: List of (token_address, oracle_address) pairs
+        max_ages: Maximum accepted price age in seconds per asset (defaults to DEFAULT_PRICE_HEARTBEAT)
+
+    Returns:
+        List of (price, asset_config) pairs in the same order as assets
+    """
+    if max_ages is None:
+        max_ages = [DEFAULT_PRICE_HEARTBEAT] * len(assets)
+
+    results = {}
+    missing = []
+    missing_max_ages = []
+
+    for (token_address, oracle_address), max_age in zip(assets, max_ages):
+        if (token_address, oracle_address) in results or (token_address, oracle_address) in missing:
+            # Aliased symbols share an underlying token; fetch it only once
+            continue
+        price = _get_cached(_price_cache, (oracle_address, token_address), PRICE_CACHE_TTL)
+        asset_config = _get_cached(_config_cache, (pdp_contract.address, token_address), CONFIG_CACHE_TTL)
+        if price is not None and asset_config is not None:
+            results[(token_address, oracle_address)] = (price, asset_config)
+        else:
+            missing.append((token_address, oracle_address))
+            missing_max_ages.append(max_age)
+
+    if missing:
+        try:
+            # One eth_call for every getAssetPrice + getReserveConfigurationData + latestRoundData
+            fetched = fetch_asset_data_multicall(w3, pdp_contract, missing, missing_max_ages)
+        except Exception as e:
+            logger.warning("Multicall failed on %s, falling back to batch request: %s", network, e)
+            try:
+                fetched = fetch_asset_data_batch(w3, pdp_contract, missing, missing_max_ages)
+            except Exception as e:
+                logger.warning("Batch request failed on %s, falling back to concurrent calls: %s", network, e)
+                fetched = fetch_asset_data_concurrent(w3, pdp_contract, missing, missing_max_ages)
+
+        for (token_address, oracle_address), (price, asset_config) in zip(missing, fetched):
+            if price > 0:
+                _set_cached(_price_cache, (oracle_address, token_address), price)
+            if asset_config:
+                _set_cached(_config_cache, (pdp_contract.address, token_address), asset_config)
+            results[(token_address, oracle_address)] = (price, asset_config)
+
+    return [results[asset] for asset in assets]
 
 
 def get_all_real_time_asset_data(network: str, cfg: dict) -> dict:
@@ -182,7 +643,7 @@ def get_all_real_time_asset_data(network: str, cfg: dict) -> dict:
         # Get Protocol Data Provider
         pdp_address = cfg.get("AAVE_PROTOCOL_DATA_PROVIDER")
         if not pdp_address:
-            print(f"[WARN] No Protocol Data Provider found for {network}")
+            logger.warning("No Protocol Data Provider found for %s", network)
             return {}
 
         pdp_data = get_protocol_data_provider(w3, pdp_address)
@@ -190,28 +651,32 @@ def get_all_real_time_asset_data(network: str, cfg: dict) -> dict:
             return {}
 
         real_time_data = {}
+        assets = []
 
         for token_symbol, asset_data in cfg["assets"].items():
             token_address = asset_data["underlying"]
             oracle_address = asset_data.get("oracle")
 
             if not oracle_address:
-                print(f"[DEBUG] No per-token oracle found for {token_symbol}, checking network-level oracle")
+                logger.debug("No per-token oracle found for %s, checking network-level oracle", token_symbol)
                 # Fall back to network-level oracle if available
                 network_oracle = cfg.get("oracle")
                 if network_oracle:
                     oracle_address = network_oracle
-                    print(f"[DEBUG] Using network-level oracle: {oracle_address} for {token_symbol}")
+                    logger.debug("Using network-level oracle: %s for %s", oracle_address, token_symbol)
                 else:
-                    print(f"[WARN] No oracle address found for {token_symbol}")
+                    logger.warning("No oracle address found for %s", token_symbol)
                     continue
 
-            # Get real-time price
-            price = get_token_price_oracle(w3, token_address, oracle_address)
+            assets.append((token_symbol, token_address, oracle_address))
 
-            # Get real-time asset configuration
-            asset_config = get_asset_real_time_data(w3, pdp_data["contract"], token_address)
+        results = fetch_asset_data(
+            w3, network, pdp_data["contract"],
+            [(token, oracle) for _, token, oracle in assets],
+            [get_price_heartbeat(symbol) for symbol, _, _ in assets]
+        )
 
+        for (token_symbol, token_address, oracle_address), (price, asset_config) in zip(assets, results):
             real_time_data[token_symbol] = {
                 "price": price,
                 "liquidation_threshold": asset_config["liquidation_threshold"] if asset_config else 0.80,
@@ -221,12 +686,16 @@ def get_all_real_time_asset_data(network: str, cfg: dict) -> dict:
                 "oracle_address": oracle_address  # Store oracle address for debugging
             }
 
-            print(f"[DEBUG] Real-time data for {token_symbol}: ${price:.2f}, LT: {real_time_data[token_symbol]['liquidation_threshold']:.2%} (Oracle: {oracle_address[:10]}...)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Real-time data for %s: $%.2f, LT: %.2f%% (Oracle: %s...)",
+                    token_symbol, price, real_time_data[token_symbol]["liquidation_threshold"] * 100, oracle_address[:10]
+                )
 
         return real_time_data
 
     except Exception as e:
-        print(f"[ERROR] Failed to get real-time asset data: {e}")
+        logger.error("Failed to get real-time asset data: %s", e)
         return {}
 
 
@@ -246,7 +715,7 @@ def get_real_time_token_price(network: str, token_symbol: str, cfg: dict) -> flo
         w3, _, _ = init_web3(network)
 
         if token_symbol not in cfg["assets"]:
-            print(f"[WARN] Token {token_symbol} not found in network configuration")
+            logger.warning("Token %s not found in network configuration", token_symbol)
             return get_fallback_price(token_symbol)
 
         asset_data = cfg["assets"][token_symbol]
@@ -254,22 +723,22 @@ def get_real_time_token_price(network: str, token_symbol: str, cfg: dict) -> flo
         oracle_address = asset_data.get("oracle")
 
         if not oracle_address:
-            print(f"[DEBUG] No per-token oracle for {token_symbol}, checking network-level oracle...")
+            logger.debug("No per-token oracle for %s, checking network-level oracle...", token_symbol)
             # Fall back to network-level oracle if available
             network_oracle = cfg.get("oracle")
             if network_oracle:
                 oracle_address = network_oracle
-                print(f"[DEBUG] Using network-level oracle: {oracle_address} for {token_symbol}")
+                logger.debug("Using network-level oracle: %s for %s", oracle_address, token_symbol)
             else:
-                print(f"[WARN] No oracle for {token_symbol}, using fallback price")
+                logger.warning("No oracle for %s, using fallback price", token_symbol)
                 return get_fallback_price(token_symbol)
         else:
-            print(f"[DEBUG] Using per-token oracle: {oracle_address} for {token_symbol}")
+            logger.debug("Using per-token oracle: %s for %s", oracle_address, token_symbol)
 
-        return get_token_price_oracle(w3, token_address, oracle_address)
+        return get_token_price_oracle(w3, token_address, oracle_address, get_price_heartbeat(token_symbol))
 
     except Exception as e:
-        print(f"[ERROR] Failed to get real-time price for {token_symbol}: {e}")
+        logger.error("Failed to get real-time price for %s: %s", token_symbol, e)
         return get_fallback_price(token_symbol)
 
 
@@ -290,50 +759,32 @@ def get_real_time_liquidation_threshold(network: str, token_symbol: str, cfg: di
 
         pdp_address = cfg.get("AAVE_PROTOCOL_DATA_PROVIDER")
         if not pdp_address:
-            print(f"[DEBUG] No Protocol Data Provider found for {network}, using fallback LT for {token_symbol}")
+            logger.debug("No Protocol Data Provider found for %s, using fallback LT for %s", network, token_symbol)
             return get_fallback_liquidation_threshold(token_symbol)
 
         pdp_data = get_protocol_data_provider(w3, pdp_address)
         if not pdp_data:
-            print(f"[DEBUG] Could not initialize Protocol Data Provider, using fallback LT for {token_symbol}")
+            logger.debug("Could not initialize Protocol Data Provider, using fallback LT for %s", token_symbol)
             return get_fallback_liquidation_threshold(token_symbol)
 
         token_address = cfg["assets"][token_symbol]["underlying"]
         asset_config = get_asset_real_time_data(w3, pdp_data["contract"], token_address)
 
         lt = asset_config["liquidation_threshold"] if asset_config else get_fallback_liquidation_threshold(token_symbol)
-        print(f"[DEBUG] Real-time LT for {token_symbol}: {lt:.2%}")
+        logger.debug("Real-time LT for %s: %.2f%%", token_symbol, lt * 100)
 
         return lt
 
     except Exception as e:
-        print(f"[ERROR] Failed to get real-time liquidation threshold for {token_symbol}: {e}")
+        logger.error("Failed to get real-time liquidation threshold for %s: %s", token_symbol, e)
         return get_fallback_liquidation_threshold(token_symbol)
 
 
 def get_fallback_price(token_symbol: str) -> float:
     """Fallback prices when oracle is unavailable"""
-    fallback_prices = {
-        "USDC": 1.0,
-        "USDT": 1.0,
-        "DAI": 1.0,
-        "WETH": 2000.0,
-        "WBTC": 50000.0,
-        "LINK": 15.0,
-        "cbETH": 3000.0,
-    }
-    return fallback_prices.get(token_symbol, 1.0)
+    return FALLBACK_PRICES.get(token_symbol, 1.0)
 
 
 def get_fallback_liquidation_threshold(token_symbol: str) -> float:
     """Fallback liquidation thresholds when oracle is unavailable"""
-    fallback_thresholds = {
-        "USDC": 0.90,
-        "USDT": 0.90,
-        "DAI": 0.90,
-        "WETH": 0.85,
-        "WBTC": 0.85,
-        "LINK": 0.80,
-        "cbETH": 0.85,
-    }
-    return fallback_thresholds.get(token_symbol, 0.80)
\ No newline at end of file
+    return FALLBACK_LIQUIDATION_THRESHOLDS.get(token_symbol, 0.80)
@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Modules are imported flat from the app directory, as main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# config.py refuses to import without credentials; no test talks to a real node
+os.environ.setdefault("ALCHEMY_API_KEY", "test")
+os.environ.setdefault("EXECUTOR_PRIVATE_KEY", "0x" + "11" * 32)
+os.environ["RPC_CU_PER_SECOND"] = "0"
@@ -0,0 +1,44 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+from models import AaveRequest
+from utils import amount_to_wei
+
+USER = "0x1111111111111111111111111111111111111111"
+
+
+def parse_amount(body: str) -> Decimal:
+    # FastAPI hands pydantic the json.loads result, so a JSON number is a float by then
+    return AaveRequest(**json.loads(body)).amount
+
+
+@pytest.mark.parametrize("amount, token, expected", [
+    (Decimal("1.1"), "WETH", 1100000000000000000),
+    (Decimal("0.1"), "WETH", 100000000000000000),
+    (Decimal("100.5"), "USDC", 100500000),
+    (Decimal("0.00000001"), "WBTC", 1),
+    (Decimal("123456789.123456789123456789"), "WETH", 123456789123456789123456789),
+])
+def test_amount_to_wei_scales_exactly(amount, token, expected):
+    assert amount_to_wei(amount, token) == expected
+
+
+def test_amount_to_wei_accepts_legacy_floats():
+    assert amount_to_wei(1.1, "WETH") == 1100000000000000000
+
+
+def test_json_number_amount_converts_without_float_error():
+    body = f'{{"amount": 1.1, "token": "WETH", "user_address": "{USER}"}}'
+    assert amount_to_wei(parse_amount(body), "WETH") == 1100000000000000000
+
+
+def test_json_string_amount_keeps_every_digit():
+    body = f'{{"amount": "123456789.123456789123456789", "token": "WETH", "user_address": "{USER}"}}'
+    assert amount_to_wei(parse_amount(body), "WETH") == 123456789123456789123456789
+
+
+def test_amount_to_wei_uses_config_decimals():
+    cfg = {"assets": {"TKN": {"decimals": 3}}}
+    assert amount_to_wei(Decimal("2.5"), "TKN", cfg) == 2500
@@ -0,0 +1,185 @@
+import json
+from urllib.parse import urlparse
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+import contracts
+from contracts import FailoverHTTPProvider
+
+PRIMARY = "http://primary.invalid"
+BACKUP = "http://backup.invalid"
+OK = {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+RATE_LIMITED = {"jsonrpc": "2.0", "id": 1, "error": {"code": 429, "message": "rate limit exceeded"}}
+
+
+class FakeTransport(BaseAdapter):
+    """requests transport adapter that answers from a handler and counts what reached the wire."""
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        return self.handler(request)
+
+    def close(self):
+        pass
+
+
+def respond(body, status=200):
+    def handler(request):
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+    return handler
+
+
+def fail(error_type):
+    def handler(request):
+        raise error_type("simulated", request=request)
+    return handler
+
+
+def session_for(transport):
+    session = requests.Session()
+    session.mount("http://", transport)
+    return session
+
+
+@pytest.fixture
+def transports(monkeypatch):
+    """Primary and backup transports; backups get theirs through build_rpc_session."""
+    primary = FakeTransport(respond(OK))
+    backup = FakeTransport(respond(OK))
+    monkeypatch.setattr(contracts, "build_rpc_session", lambda: session_for(backup))
+    return primary, backup
+
+
+def make_provider(primary):
+    # Built the way init_web3 builds it
+    return FailoverHTTPProvider(
+        PRIMARY, [BACKUP], session=session_for(primary), exception_retry_configuration=None
+    )
+
+
+def test_fails_over_after_a_single_http_429(transports):
+    primary, backup = transports
+    primary.handler = respond({"error": "too many requests"}, status=429)
+    provider = make_provider(primary)
+
+    assert provider.make_request("eth_blockNumber", [])["result"] == "0x1"
+    assert (primary.calls, backup.calls) == (1, 1)
+
+
+def test_sticks_to_the_backup_once_it_answered(transports):
+    primary, backup = transports
+    primary.handler = fail(requests.ConnectionError)
+    provider = make_provider(primary)
+
+    provider.make_request("eth_blockNumber", [])
+    provider.make_request("eth_blockNumber", [])
+    assert (primary.calls, backup.calls) == (1, 2)
+
+
+def test_fails_over_on_rate_limit_json_rpc_error(transports):
+    primary, backup = transports
+    primary.handler = respond(RATE_LIMITED)
+    provider = make_provider(primary)
+
+    assert provider.make_request("eth_call", [])["result"] == "0x1"
+    assert (primary.calls, backup.calls) == (1, 1)
+
+
+def test_wraps_around_to_primary_when_backup_fails(transports):
+    primary, backup = transports
+    primary.handler = fail(requests.ConnectionError)
+    provider = make_provider(primary)
+    provider.make_request("eth_call", [])
+
+    primary.handler = respond(OK)
+    backup.handler = fail(requests.ConnectionError)
+    assert provider.make_request("eth_call", [])["result"] == "0x1"
+    assert (primary.calls, backup.calls) == (2, 2)
+
+
+def test_last_endpoint_response_is_returned_even_if_rate_limited(transports):
+    primary, backup = transports
+    primary.handler = respond(RATE_LIMITED)
+    backup.handler = respond(RATE_LIMITED)
+    provider = make_provider(primary)
+
+    assert provider.make_request("eth_call", [])["error"]["code"] == 429
+
+
+def test_non_retryable_http_errors_are_raised_without_failover(transports):
+    primary, backup = transports
+    primary.handler = respond({"error": "bad request"}, status=400)
+    provider = make_provider(primary)
+
+    with pytest.raises(requests.HTTPError):
+        provider.make_request("eth_call", [])
+    assert (primary.calls, backup.calls) == (1, 0)
+
+
+@pytest.mark.parametrize("method", ["eth_sendRawTransaction", "eth_sendRawTransactionSync"])
+def test_sends_that_may_have_reached_the_node_are_not_replayed(transports, method):
+    primary, backup = transports
+    primary.handler = fail(requests.ReadTimeout)
+    provider = make_provider(primary)
+
+    with pytest.raises(requests.ReadTimeout):
+        provider.make_request(method, ["0x00"])
+    assert (primary.calls, backup.calls) == (1, 0)
+
+
+def test_sends_fail_over_when_the_connection_was_never_made(transports):
+    primary, backup = transports
+    primary.handler = fail(requests.ConnectTimeout)
+    provider = make_provider(primary)
+
+    assert provider.make_request("eth_sendRawTransaction", ["0x00"])["result"] == "0x1"
+    assert (primary.calls, backup.calls) == (1, 1)
+
+
+@pytest.fixture
+def network(monkeypatch):
+    """A base-sepolia entry whose endpoints all go through one fake transport, keyed by host."""
+    hits = {}
+
+    def handler(request):
+        host = urlparse(request.url).hostname
+        hits[host] = hits.get(host, 0) + 1
+        return respond({"error": "too many requests"}, status=429)(request) if host == "primary.invalid" else respond(OK)(request)
+
+    transport = FakeTransport(handler)
+    monkeypatch.setattr(contracts, "build_rpc_session", lambda: session_for(transport))
+    monkeypatch.setattr(contracts, "_web3_cache", {})
+    monkeypatch.setitem(contracts.NETWORK_CONFIG, "base-sepolia", {
+        **contracts.NETWORK_CONFIG["base-sepolia"], "rpc": PRIMARY, "backup_rpcs": [],
+    })
+    return hits
+
+
+def test_init_web3_disables_the_builtin_provider_retry(network):
+    w3, _, _ = contracts.init_web3("base-sepolia")
+    assert w3.provider.exception_retry_configuration is None
+
+    with pytest.raises(requests.HTTPError):
+        w3.provider.make_request("eth_blockNumber", [])
+    assert network == {"primary.invalid": 1}
+
+
+def test_init_web3_fails_over_after_one_attempt(network, monkeypatch):
+    monkeypatch.setitem(contracts.NETWORK_CONFIG["base-sepolia"], "backup_rpcs", [BACKUP])
+    w3, _, _ = contracts.init_web3("base-sepolia")
+
+    assert w3.provider.make_request("eth_blockNumber", [])["result"] == "0x1"
+    assert network == {"primary.invalid": 1, "backup.invalid": 1}
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import pytest
+from web3.exceptions import MethodUnavailable
+
+import utils
+from utils import MIN_PRIORITY_FEE, get_fee_params
+
+
+class FakeEth:
+    def __init__(self, history=None, gas_price=3 * 10**9):
+        self.history = history
+        self.gas_price_value = gas_price
+        self.fee_history_calls = 0
+
+    def fee_history(self, block_count, newest_block, percentiles):
+        self.fee_history_calls += 1
+        if self.history is None:
+            raise MethodUnavailable("the method eth_feeHistory does not exist/is not available")
+        return self.history
+
+    @property
+    def gas_price(self):
+        return self.gas_price_value
+
+
+def make_w3(**kwargs):
+    return SimpleNamespace(eth=FakeEth(**kwargs))
+
+
+@pytest.fixture(autouse=True)
+def empty_caches(monkeypatch):
+    monkeypatch.setattr(utils, "_fee_params_cache", {})
+    monkeypatch.setattr(utils, "_gas_price_cache", {})
+
+
+def test_type2_fees_from_fee_history():
+    w3 = make_w3(history={"baseFeePerGas": [10**9, 2 * 10**9], "reward": [[5 * 10**8]]})
+    assert get_fee_params(w3) == {
+        "type": 2,
+        "maxFeePerGas": 2 * (2 * 10**9) + 5 * 10**8,
+        "maxPriorityFeePerGas": 5 * 10**8,
+    }
+
+
+def test_priority_fee_has_a_floor_on_tipless_blocks():
+    w3 = make_w3(history={"baseFeePerGas": [100, 100], "reward": [[0]]})
+    fees = get_fee_params(w3)
+    assert fees["maxPriorityFeePerGas"] == MIN_PRIORITY_FEE
+    assert fees["maxFeePerGas"] == 200 + MIN_PRIORITY_FEE
+
+
+def test_falls_back_to_legacy_gas_price_without_fee_history():
+    w3 = make_w3(history=None, gas_price=7 * 10**9)
+    assert get_fee_params(w3) == {"gasPrice": 7 * 10**9}
+
+
+def test_fee_params_are_cached_per_connection():
+    w3 = make_w3(history={"baseFeePerGas": [1, 1], "reward": [[MIN_PRIORITY_FEE]]})
+    assert get_fee_params(w3) is get_fee_params(w3)
+    assert w3.eth.fee_history_calls == 1
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+import eth_abi
+import pytest
+from fastapi import HTTPException
+from hexbytes import HexBytes
+from pydantic import ValidationError
+
+from api import routes
+from contracts import AGGREGATE3_INPUT_TYPES, AGGREGATE3_OUTPUT_TYPES, AGGREGATE3_SELECTOR
+from models import MAX_HEALTH_BATCH_SIZE, HealthBatchRequest
+from utils import GET_USER_ACCOUNT_DATA_SELECTOR, get_health_factors
+
+POOL = "0x8bAB6d1b75f19e9eD9fCe8b9BD338844fF79aE27"
+ALICE = "0x1111111111111111111111111111111111111111"
+BOB = "0x2222222222222222222222222222222222222222"
+CAROL = "0x3333333333333333333333333333333333333333"
+
+
+def account_data(health_factor: int) -> bytes:
+    return eth_abi.encode(["uint256"] * 6, [1, 2, 3, 4, 5, health_factor])
+
+
+class FakeWeb3:
+    """Answers the aggregate3 eth_call with canned (success, returnData) results."""
+
+    def __init__(self, results):
+        self.requests = []
+        self.codec = SimpleNamespace(decode=eth_abi.decode)
+        self.eth = SimpleNamespace(call=self._call)
+        self._return_data = eth_abi.encode(AGGREGATE3_OUTPUT_TYPES, [results])
+
+    def _call(self, tx):
+        self.requests.append(tx)
+        return HexBytes(self._return_data)
+
+
+def test_health_factors_read_every_user_in_one_call():
+    w3 = FakeWeb3([(True, account_data(15 * 10**17)), (True, account_data(0))])
+    assert get_health_factors(w3, POOL, [ALICE, BOB]) == {ALICE: 1.5, BOB: 100.0}
+
+    (tx,) = w3.requests
+    (calls,) = eth_abi.decode(AGGREGATE3_INPUT_TYPES, bytes.fromhex(tx["data"][len(AGGREGATE3_SELECTOR):]))
+    assert [data[:4].hex() for _, _, data in calls] == [GET_USER_ACCOUNT_DATA_SELECTOR[2:]] * 2
+
+
+def test_failed_reads_map_to_none():
+    w3 = FakeWeb3([(False, b""), (True, b""), (True, account_data(2 * 10**18))])
+    assert get_health_factors(w3, POOL, [ALICE, BOB, CAROL]) == {ALICE: None, BOB: None, CAROL: 2.0}
+
+
+@pytest.fixture
+def batch_w3(monkeypatch):
+    w3 = FakeWeb3([(True, account_data(10**18)), (False, b"")])
+    monkeypatch.setattr(routes, "init_web3", lambda network, with_executor=False: (w3, None, {"pool_provider": POOL}))
+    monkeypatch.setattr(routes, "get_pool_address", lambda w3, provider: POOL)
+    return w3
+
+
+def test_batch_route_reports_each_user(batch_w3):
+    result = routes.health_batch(HealthBatchRequest(user_addresses=[ALICE, BOB.lower()]))
+    assert result["users"] == {
+        ALICE: {"health_factor": 1.0, "safe_to_borrow": False},
+        BOB: None,
+    }
+    assert len(batch_w3.requests) == 1
+
+
+def test_batch_route_rejects_invalid_address(batch_w3):
+    with pytest.raises(HTTPException) as exc:
+        routes.health_batch(HealthBatchRequest(user_addresses=[ALICE, "0x1234"]))
+    assert exc.value.status_code == 400
+    assert batch_w3.requests == []
+
+
+@pytest.mark.parametrize("count", [0, MAX_HEALTH_BATCH_SIZE + 1])
+def test_batch_request_size_is_bounded(count):
+    with pytest.raises(ValidationError):
+        HealthBatchRequest(user_addresses=[ALICE] * count)
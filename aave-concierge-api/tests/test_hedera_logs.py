@@ -0,0 +1,50 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import utils
+from utils import flush_logs, schedule_log, track_request_logs
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Record delivered messages; anything starting with 'slow' blocks until released."""
+    delivered = []
+    release = threading.Event()
+
+    async def fake_log_to_hedera(msg):
+        if msg.startswith("slow"):
+            await asyncio.get_running_loop().run_in_executor(None, release.wait)
+        delivered.append(msg)
+
+    monkeypatch.setattr(utils, "log_to_hedera", fake_log_to_hedera)
+    yield delivered
+    release.set()
+
+
+def run_request(*messages):
+    """Schedule messages the way a route does and flush them like the middleware."""
+    async def request():
+        pending = track_request_logs()
+        for msg in messages:
+            schedule_log(msg)
+        await flush_logs(pending, timeout=2)
+
+    asyncio.run(request())
+
+
+def test_flush_waits_for_the_requests_own_logs(sent):
+    run_request("supply", "borrow")
+    assert {"supply", "borrow"} <= set(sent)
+
+
+def test_request_without_logs_does_not_wait_for_the_queue(sent):
+    threading.Thread(target=run_request, args=("slow audit",), daemon=True).start()
+
+    start = time.monotonic()
+    run_request()
+    assert time.monotonic() - start < 0.5
+    assert "slow audit" not in sent
+
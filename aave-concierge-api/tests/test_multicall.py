@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import eth_abi
+from hexbytes import HexBytes
+
+from contracts import (
+    AGGREGATE3_INPUT_TYPES, AGGREGATE3_OUTPUT_TYPES, AGGREGATE3_SELECTOR, MULTICALL3_ADDRESS,
+    execute_multicall, multicall,
+)
+
+TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+POOL = "0x8bAB6d1b75f19e9eD9fCe8b9BD338844fF79aE27"
+
+
+class FakeWeb3:
+    """Answers eth_call with a canned aggregate3 result and records the request."""
+
+    def __init__(self, results):
+        self.requests = []
+        self.codec = SimpleNamespace(decode=eth_abi.decode)
+        self.eth = SimpleNamespace(call=self._call)
+        self._return_data = eth_abi.encode(AGGREGATE3_OUTPUT_TYPES, [results])
+
+    def _call(self, tx):
+        self.requests.append(tx)
+        return HexBytes(self._return_data)
+
+
+def test_multicall_encodes_aggregate3_calldata():
+    w3 = FakeWeb3([(True, b"")])
+    multicall(w3, [(TOKEN, "0x70a08231" + "00" * 32), (POOL, "0xbf92857c" + "ab" * 32)])
+
+    (tx,) = w3.requests
+    assert tx["to"] == MULTICALL3_ADDRESS
+    assert tx["data"].startswith(AGGREGATE3_SELECTOR)
+    (calls,) = eth_abi.decode(AGGREGATE3_INPUT_TYPES, bytes.fromhex(tx["data"][len(AGGREGATE3_SELECTOR):]))
+    assert [(target.lower(), allow_failure, data) for target, allow_failure, data in calls] == [
+        (TOKEN.lower(), True, bytes.fromhex("70a08231" + "00" * 32)),
+        (POOL.lower(), True, bytes.fromhex("bf92857c" + "ab" * 32)),
+    ]
+
+
+def test_multicall_returns_none_for_reverted_calls():
+    w3 = FakeWeb3([(True, (5).to_bytes(32, "big")), (False, b"revert")])
+    assert multicall(w3, [(TOKEN, "0x"), (POOL, "0x")]) == [(5).to_bytes(32, "big"), None]
+
+
+def test_execute_multicall_decodes_each_result():
+    w3 = FakeWeb3([(True, (7).to_bytes(32, "big")), (False, b"")])
+    decode = lambda data: int.from_bytes(data, "big")
+    assert execute_multicall(w3, [(TOKEN, "0x", decode), (POOL, "0x", decode)]) == [7, 0]
@@ -0,0 +1,58 @@
+import time
+
+import eth_abi
+import pytest
+from pydantic import ValidationError
+from web3 import Web3
+
+from contracts import POOL_CALL_SIGNATURES, encode_pool_call
+from models import AaveRequest, PermitSignature
+
+TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+USER = "0x1111111111111111111111111111111111111111"
+R = "0x" + "ab" * 32
+S = "0x" + "cd" * 32
+
+
+def future_deadline():
+    return int(time.time()) + 3600
+
+
+@pytest.mark.parametrize("name", sorted(POOL_CALL_SIGNATURES))
+def test_pool_call_selectors_match_their_signatures(name):
+    selector, arg_types = POOL_CALL_SIGNATURES[name]
+    signature = f"{name}({','.join(arg_types)})"
+    assert selector == "0x" + Web3.keccak(text=signature)[:4].hex().removeprefix("0x")
+
+
+def test_supply_with_permit_calldata():
+    deadline = future_deadline()
+    data = encode_pool_call(
+        "supplyWithPermit", TOKEN, 10**6, USER, 0, deadline, 27, bytes.fromhex(R[2:]), bytes.fromhex(S[2:])
+    )
+
+    assert data.startswith("0x02c205f0")
+    args = eth_abi.decode(POOL_CALL_SIGNATURES["supplyWithPermit"][1], bytes.fromhex(data[len("0x02c205f0"):]))
+    asset, amount, on_behalf_of, *rest = args
+    assert (asset.lower(), on_behalf_of.lower()) == (TOKEN.lower(), USER.lower())
+    assert [amount, *rest] == [10**6, 0, deadline, 27, bytes.fromhex(R[2:]), bytes.fromhex(S[2:])]
+
+
+def test_valid_permit_is_accepted():
+    permit = PermitSignature(deadline=future_deadline(), v=28, r=R, s=S)
+    req = AaveRequest(amount="1", token="USDC", user_address=USER, permit=permit)
+    assert req.permit.v == 28
+
+
+@pytest.mark.parametrize("field, value", [
+    ("r", "0x" + "ab" * 31),        # too short
+    ("s", "cd" * 32),               # missing 0x
+    ("r", "0x" + "zz" * 32),        # not hex
+    ("v", 256),
+    ("v", -1),
+    ("deadline", int(time.time()) - 1),
+])
+def test_malformed_permit_is_rejected(field, value):
+    fields = {"deadline": future_deadline(), "v": 27, "r": R, "s": S, field: value}
+    with pytest.raises(ValidationError):
+        PermitSignature(**fields)
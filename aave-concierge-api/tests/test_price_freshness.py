@@ -0,0 +1,74 @@
+import time
+from types import SimpleNamespace
+
+import eth_abi
+import pytest
+from hexbytes import HexBytes
+
+import oracle
+from oracle import LATEST_ROUND_DATA_SELECTOR, ROUND_DATA_TYPES, ZERO_ADDRESS, check_price_freshness, is_price_fresh
+
+TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+ORACLE = "0x2Da88497588bf726262B7D4b1D5F5e8dd7E2D6dc"
+SOURCE = "0xd30e2101a97dcbAeBCBC04F14C3f624E67A35165"
+HEARTBEAT = 3600
+
+
+def round_data(age=60, round_id=10, answered_in_round=10):
+    return (round_id, 2000 * 10**8, int(time.time()) - age, int(time.time()) - age, answered_in_round)
+
+
+class FakeWeb3:
+    def __init__(self, rounds=None):
+        self.codec = SimpleNamespace(decode=eth_abi.decode)
+        self.eth = SimpleNamespace(call=self._call)
+        self.rounds = rounds
+        self.requests = []
+
+    def _call(self, tx):
+        self.requests.append(tx)
+        if self.rounds is None:
+            raise ValueError("execution reverted")
+        return HexBytes(eth_abi.encode(ROUND_DATA_TYPES, self.rounds))
+
+
+@pytest.fixture
+def source(monkeypatch):
+    resolved = {"address": SOURCE}
+    monkeypatch.setattr(oracle, "get_price_sources", lambda w3, assets: [resolved["address"]] * len(assets))
+    return resolved
+
+
+def test_recent_complete_round_is_fresh():
+    assert is_price_fresh(round_data(age=60), HEARTBEAT, TOKEN)
+
+
+def test_round_older_than_heartbeat_is_stale():
+    assert not is_price_fresh(round_data(age=HEARTBEAT + 60), HEARTBEAT, TOKEN)
+
+
+def test_incomplete_round_is_rejected():
+    assert not is_price_fresh(round_data(round_id=11, answered_in_round=10), HEARTBEAT, TOKEN)
+
+
+def test_check_reads_latest_round_of_the_source(source):
+    w3 = FakeWeb3(round_data(age=60))
+    assert check_price_freshness(w3, TOKEN, ORACLE, HEARTBEAT)
+    assert w3.requests == [{"to": SOURCE, "data": LATEST_ROUND_DATA_SELECTOR}]
+
+
+def test_check_rejects_stale_source_round(source):
+    assert not check_price_freshness(FakeWeb3(round_data(age=HEARTBEAT + 60)), TOKEN, ORACLE, HEARTBEAT)
+
+
+def test_check_rejects_incomplete_source_round(source):
+    assert not check_price_freshness(FakeWeb3(round_data(round_id=11, answered_in_round=10)), TOKEN, ORACLE, HEARTBEAT)
+
+
+def test_check_skips_unknown_or_unreadable_sources(source):
+    assert check_price_freshness(FakeWeb3(None), TOKEN, ORACLE, HEARTBEAT)
+
+    source["address"] = ZERO_ADDRESS
+    w3 = FakeWeb3(round_data(age=HEARTBEAT + 60))
+    assert check_price_freshness(w3, TOKEN, ORACLE, HEARTBEAT)
+    assert w3.requests == []
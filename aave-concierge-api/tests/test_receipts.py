@@ -0,0 +1,167 @@
+import threading
+import time
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound, Web3RPCError
+
+import contracts
+from contracts import ReceiptWatcher, _format_sync_receipt, is_method_unsupported_error
+
+TX_HASH = HexBytes("0x" + "ab" * 32)
+OTHER_HASH = HexBytes("0x" + "cd" * 32)
+
+
+class FakeEth:
+    def __init__(self):
+        self.head = 10
+        self.mined = {}  # tx_hash -> receipt, visible to eth_getTransactionReceipt
+        self.blocks = {}  # block number -> receipts, visible to eth_getBlockReceipts
+        self.receipt_calls = 0
+
+    @property
+    def block_number(self):
+        return self.head
+
+    def get_transaction_receipt(self, tx_hash):
+        self.receipt_calls += 1
+        receipt = self.mined.get(HexBytes(tx_hash))
+        if receipt is None:
+            raise TransactionNotFound(f"{HexBytes(tx_hash).to_0x_hex()} not found")
+        return receipt
+
+    def get_block_receipts(self, number):
+        return self.blocks.get(number, [])
+
+
+class FakeWeb3:
+    def __init__(self):
+        self.eth = FakeEth()
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(contracts, "RECEIPT_POLL_LATENCY", 0.01)
+
+
+def mine_later(w3, delay, tx_hash, receipt, via_block=False):
+    def mine():
+        time.sleep(delay)
+        if via_block:
+            w3.eth.blocks[w3.eth.head + 1] = [receipt]
+        else:
+            w3.eth.mined[tx_hash] = receipt
+        w3.eth.head += 1
+
+    threading.Thread(target=mine, daemon=True).start()
+
+
+def test_returns_receipt_already_mined():
+    w3 = FakeWeb3()
+    receipt = {"transactionHash": TX_HASH, "status": 1}
+    w3.eth.mined[TX_HASH] = receipt
+
+    assert ReceiptWatcher(w3).wait(TX_HASH, timeout=1) == receipt
+
+
+def test_resolves_when_receipt_lands_in_a_new_block():
+    w3 = FakeWeb3()
+    receipt = {"transactionHash": TX_HASH, "status": 1}
+    watcher = ReceiptWatcher(w3)
+    mine_later(w3, 0.05, TX_HASH, receipt)
+
+    assert watcher.wait(TX_HASH.to_0x_hex(), timeout=2) == receipt
+    assert watcher._pending == {}
+
+
+def test_concurrent_waiters_for_the_same_hash_share_the_receipt():
+    w3 = FakeWeb3()
+    receipt = {"transactionHash": TX_HASH, "status": 1}
+    watcher = ReceiptWatcher(w3)
+    results = []
+    waiters = [threading.Thread(target=lambda: results.append(watcher.wait(TX_HASH, timeout=2))) for _ in range(3)]
+    for waiter in waiters:
+        waiter.start()
+    mine_later(w3, 0.05, TX_HASH, receipt)
+    for waiter in waiters:
+        waiter.join()
+
+    assert results == [receipt] * 3
+
+
+def test_uses_block_receipts_once_enough_transactions_are_pending(monkeypatch):
+    monkeypatch.setattr(contracts, "BLOCK_RECEIPTS_MIN_PENDING", 1)
+    w3 = FakeWeb3()
+    receipt = {"transactionHash": TX_HASH, "status": 1}
+    watcher = ReceiptWatcher(w3)
+    mine_later(w3, 0.05, TX_HASH, receipt, via_block=True)
+
+    assert watcher.wait(TX_HASH, timeout=2) == receipt
+    # One direct check on registration and one per-tx check on the first loop pass;
+    # later blocks are covered by eth_getBlockReceipts
+    assert w3.eth.receipt_calls <= 2
+
+
+def test_times_out_and_forgets_the_transaction():
+    w3 = FakeWeb3()
+    watcher = ReceiptWatcher(w3)
+
+    with pytest.raises(TimeExhausted):
+        watcher.wait(OTHER_HASH, timeout=0.05)
+    assert watcher._pending == {}
+
+
+def test_sync_receipt_has_the_same_shape_as_get_transaction_receipt():
+    raw = {
+        "transactionHash": "0x" + "ab" * 32,
+        "blockHash": "0x" + "01" * 32,
+        "blockNumber": "0x1b4",
+        "transactionIndex": "0x0",
+        "from": "0x" + "aa" * 20,
+        "to": "0x" + "bb" * 20,
+        "cumulativeGasUsed": "0x5208",
+        "gasUsed": "0x5208",
+        "effectiveGasPrice": "0x3b9aca00",
+        "status": "0x1",
+        "type": "0x2",
+        "contractAddress": None,
+        "logs": [],
+        "logsBloom": "0x" + "00" * 256,
+    }
+    receipt = _format_sync_receipt(raw)
+
+    assert receipt.transactionHash == TX_HASH
+    assert receipt.blockNumber == 436
+    assert receipt.gasUsed == 21000
+    assert receipt.effectiveGasPrice == 10**9
+    assert receipt.status == 1
+    assert receipt["from"] == Web3.to_checksum_address("0x" + "aa" * 20)
+
+
+def rpc_error(code, message):
+    return Web3RPCError(message, rpc_response={"jsonrpc": "2.0", "id": 1, "error": {"code": code, "message": message}})
+
+
+@pytest.mark.parametrize("code, message", [
+    (-32601, "the method eth_sendRawTransactionSync does not exist/is not available"),
+    (-32004, "method not supported"),
+    (-32600, "eth_sendRawTransactionSync is not supported"),
+    (-32600, "Unsupported method: eth_sendRawTransactionSync"),
+])
+def test_method_unsupported_errors_are_recognised(code, message):
+    assert is_method_unsupported_error(rpc_error(code, message))
+
+
+@pytest.mark.parametrize("code, message", [
+    (-32600, "invalid request: missing params"),       # -32600 alone is not "unsupported"
+    (-32000, "nonce too low"),
+    (-32000, "method not supported"),                  # wrong code for the message
+    (4, "transaction not included within timeout"),
+])
+def test_other_rpc_errors_are_not_treated_as_unsupported(code, message):
+    assert not is_method_unsupported_error(rpc_error(code, message))
+
+
+def test_error_without_rpc_response_is_not_unsupported():
+    assert not is_method_unsupported_error(Web3RPCError("connection reset"))
@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from web3.datastructures import AttributeDict
+from web3.exceptions import TransactionNotFound
+
+from api import routes
+
+TX_HASH = "0x" + "ab" * 32
+
+
+class FakeEth:
+    def __init__(self, receipt=None, known=False):
+        self.receipt = receipt
+        self.known = known
+
+    def get_transaction_receipt(self, tx_hash):
+        if self.receipt is None:
+            raise TransactionNotFound(f"{tx_hash} not found")
+        return self.receipt
+
+    def get_transaction(self, tx_hash):
+        if not self.known:
+            raise TransactionNotFound(f"{tx_hash} not found")
+        return AttributeDict({"hash": tx_hash})
+
+
+@pytest.fixture
+def use_eth(monkeypatch):
+    def install(eth):
+        w3 = SimpleNamespace(eth=eth)
+        monkeypatch.setattr(routes, "init_web3", lambda network, with_executor=False: (w3, None, {}))
+    return install
+
+
+def test_tx_status_reports_mined_receipt(use_eth):
+    use_eth(FakeEth(receipt=AttributeDict(
+        {"status": 1, "blockNumber": 12, "gasUsed": 21000, "effectiveGasPrice": 10**9}
+    )))
+    result = routes.get_transaction_status("base-sepolia", TX_HASH)
+    assert result["status"] == "success"
+    assert result["block_number"] == 12
+
+
+def test_tx_status_pending_while_node_knows_the_transaction(use_eth):
+    use_eth(FakeEth(known=True))
+    assert routes.get_transaction_status("base-sepolia", TX_HASH)["status"] == "pending"
+
+
+def test_tx_status_not_found_for_unknown_or_dropped_hash(use_eth):
+    use_eth(FakeEth())
+    assert routes.get_transaction_status("base-sepolia", TX_HASH)["status"] == "not_found"
+
+
+@pytest.mark.parametrize("tx_hash", ["0x1234", "ab" * 32, "0x" + "zz" * 32])
+def test_tx_status_rejects_malformed_hash(tx_hash):
+    with pytest.raises(HTTPException) as exc:
+        routes.get_transaction_status("base-sepolia", tx_hash)
+    assert exc.value.status_code == 400
+
+
+def test_tx_status_keeps_unsupported_network_a_400():
+    with pytest.raises(HTTPException) as exc:
+        routes.get_transaction_status("not-a-network", TX_HASH)
+    assert exc.value.status_code == 400
@@ -0,0 +1,54 @@
+import pytest
+
+import contracts
+from contracts import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(contracts.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(contracts.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_burst_up_to_capacity_does_not_wait(clock):
+    bucket = TokenBucket(100)
+    bucket.acquire(60)
+    bucket.acquire(40)
+    assert clock.sleeps == []
+
+
+def test_waits_for_refill_when_empty(clock):
+    bucket = TokenBucket(100)
+    bucket.acquire(100)
+    bucket.acquire(50)
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_refills_with_elapsed_time(clock):
+    bucket = TokenBucket(100)
+    bucket.acquire(100)
+    clock.now += 1
+    bucket.acquire(100)
+    assert clock.sleeps == []
+
+
+def test_requests_above_capacity_are_clamped(clock):
+    bucket = TokenBucket(100)
+    bucket.acquire(100)
+    bucket.acquire(500)
+    assert clock.sleeps == [pytest.approx(1.0)]
@@ -1,98 +1,306 @@
 import asyncio
+import atexit
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from decimal import Context, Decimal
 import aiohttp
 from web3 import Web3
-from contracts import get_pool_contract
+
+try:
+    # Optional C implementation of EIP-55 checksumming
+    from cchecksum import to_checksum_address
+except ImportError:
+    to_checksum_address = Web3.to_checksum_address
+
+from contracts import get_pool_contract, multicall, execute_call, call_with_retry
+
+logger = logging.getLogger(__name__)
+
+# Hedera log messages are drained in batches of up to LOG_BATCH_SIZE,
+# waiting at most LOG_FLUSH_INTERVAL seconds for a batch to fill
+LOG_BATCH_SIZE = 20
+LOG_FLUSH_INTERVAL = 0.1
+# Longest a request waits at the end for its own Hedera logs to be delivered
+LOG_FLUSH_TIMEOUT = 5
+
+# Background event loop that owns the Hedera log queue, started on first use
+_log_loop = None
+_log_queue = None
+_log_loop_lock = threading.Lock()
+
+# Delivery futures of the Hedera logs scheduled by the current request, set by track_request_logs
+_request_logs = contextvars.ContextVar("hedera_request_logs", default=None)
+
+# One aiohttp session per event loop, reused by every Hedera log call
+_hedera_sessions = {}
+
+
+def _get_hedera_session():
+    """Get the shared aiohttp session for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    session = _hedera_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
+        _hedera_sessions[loop] = session
+    return session
+
+
+def _close_hedera_sessions():
+    """Close shared Hedera sessions whose event loop is still running (registered with atexit)."""
+    for loop, session in list(_hedera_sessions.items()):
+        if loop.is_running() and not session.closed:
+            try:
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=1)
+            except Exception:
+                pass
+
+
+atexit.register(_close_hedera_sessions)
 
 
 async def log_to_hedera(msg: str):
     """Asynchronously log a message to Hedera Consensus Service."""
     try:
         from config import HEDERA_LOGGER_URL
-        async with aiohttp.ClientSession() as session:
-            try:
-                await session.post(HEDERA_LOGGER_URL, json={"log_message": msg}, timeout=5)
-            except Exception as e:
-                print("[WARN] Hedera log failed:", e)
     except ImportError:
-        print("[WARN] Could not import HEDERA_LOGGER_URL, skipping logging")
+        logger.warning("Could not import HEDERA_LOGGER_URL, skipping logging")
+        return
+
+    try:
+        async with _get_hedera_session().post(HEDERA_LOGGER_URL, json={"log_message": msg}):
+            pass
+    except Exception as e:
+        logger.warning("Hedera log failed: %s", e)
+
+
+async def _hedera_log_worker():
+    """Drain the log queue, sending each batch concurrently over the shared session."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _log_queue.get()]
+        deadline = loop.time() + LOG_FLUSH_INTERVAL
+        while len(batch) < LOG_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_log_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            await asyncio.gather(*(log_to_hedera(msg) for msg, _ in batch))
+        finally:
+            for _, delivered in batch:
+                delivered.set_result(None)
+
+
+def _run_log_loop(loop):
+    """Thread target: run the Hedera logging event loop forever."""
+    global _log_queue
+    asyncio.set_event_loop(loop)
+    _log_queue = asyncio.Queue()
+    loop.create_task(_hedera_log_worker())
+    loop.run_forever()
+
+
+def _get_log_loop():
+    """Start the background logging thread on first use and return its event loop."""
+    global _log_loop
+    with _log_loop_lock:
+        if _log_loop is None:
+            _log_loop = asyncio.new_event_loop()
+            threading.Thread(target=_run_log_loop, args=(_log_loop,), name="hedera-logger", daemon=True).start()
+    return _log_loop
 
 
 def schedule_log(msg: str):
-    """Schedule a log message to be sent to Hedera asynchronously."""
-    try:
-        asyncio.create_task(log_to_hedera(msg))
-    except RuntimeError:
-        # Fallback for when no event loop is running
-        asyncio.run(log_to_hedera(msg))
+    """Schedule a log message to be sent to Hedera asynchronously.
+
+    The message is handed to a background thread and this call never blocks the caller.
+    Inside a tracked request, delivery is completed by flush_logs at the end of the request.
+    """
+    delivered = Future()
+    _get_log_loop().call_soon_threadsafe(lambda: _log_queue.put_nowait((msg, delivered)))
+    pending = _request_logs.get()
+    if pending is not None:
+        pending.append(delivered)
+
+
+def track_request_logs() -> list:
+    """Start collecting the Hedera logs scheduled by the current request.
+
+    Returns the list their delivery futures are appended to; pass it to flush_logs.
+    """
+    pending = []
+    _request_logs.set(pending)
+    return pending
+
+
+async def flush_logs(pending: list, timeout: float = LOG_FLUSH_TIMEOUT):
+    """Wait until the given scheduled Hedera logs have been sent.
+
+    Serverless instances can be frozen as soon as the response is returned, so
+    messages still queued at that point would otherwise be lost. Only the
+    request's own messages are awaited, not the whole process-wide queue.
+    """
+    if not pending:
+        return
+    _, not_done = await asyncio.wait([asyncio.wrap_future(f) for f in pending], timeout=timeout)
+    if not_done:
+        logger.warning("%d Hedera logs not delivered within %ss", len(not_done), timeout)
+
+
+# Pool getUserAccountData(address) selector; healthFactor is the sixth returned uint256
+GET_USER_ACCOUNT_DATA_SELECTOR = "0xbf92857c"
+
+
+def _decode_user_account_data(data: bytes) -> tuple:
+    """Decode the six uint256 words returned by getUserAccountData."""
+    return tuple(int.from_bytes(data[i:i + 32], "big") for i in range(0, 192, 32))
+
+
+def _decode_health_factor(data: bytes) -> float:
+    """Decode the health factor from getUserAccountData return data (100.0 when unavailable or debt-free)."""
+    health_factor = int.from_bytes(data[160:192], "big")
+    return round(health_factor / 1e18 if health_factor else 100.0, 3)
+
+
+def build_user_account_data_call(pool_address: str, user_address: str) -> tuple:
+    """Build a full getUserAccountData read as (target, calldata, decode_fn)."""
+    calldata = f"{GET_USER_ACCOUNT_DATA_SELECTOR}{int(user_address, 16):064x}"
+    return pool_address, calldata, _decode_user_account_data
+
+
+def build_health_factor_call(pool_address: str, user_address: str) -> tuple:
+    """Build a getUserAccountData health factor read as (target, calldata, decode_fn)."""
+    pool_address, calldata, _ = build_user_account_data_call(pool_address, user_address)
+    return pool_address, calldata, _decode_health_factor
 
 
 def get_health_factor(pool, user):
     """Get the health factor for a user from the Aave pool contract."""
     try:
-        data = pool.functions.getUserAccountData(user).call()
-        return round(data[5] / 1e18 if data[5] else 100.0, 3)
+        return execute_call(pool.w3, build_health_factor_call(pool.address, user))
     except Exception:
         return 100.0
 
 
+def get_health_factors(w3, pool_address: str, user_addresses: list) -> dict:
+    """Get health factors for several users with one Multicall3 eth_call.
+
+    Users whose getUserAccountData read reverted or returned nothing map to None.
+    """
+    calls = [build_health_factor_call(pool_address, user)[:2] for user in user_addresses]
+    return_data = multicall(w3, calls)
+    return {
+        user: _decode_health_factor(data) if data else None
+        for user, data in zip(user_addresses, return_data)
+    }
+
+
+# Known decimals for tokens that don't use the ERC20 default of 18
+_DECIMALS = {
+    "USDC": 6,
+    "USDCe": 6,
+    "USDCn": 6,
+    "USDT": 6,
+    "USDT0": 6,
+    "WBTC": 8,
+    "EURS": 2,
+}
+
+# Precomputed powers of ten for every valid uint8 decimals value used by ERC20 tokens
+_POW10 = [10 ** d for d in range(78)]
+# Enough precision for any uint256 so scaling to wei never rounds
+_WEI_CONTEXT = Context(prec=78)
+
+
 def get_token_decimals(token_symbol: str, cfg=None) -> int:
     """Get the decimal places for a token based on its symbol."""
     # If config is provided, use dynamic decimals from config
-    if cfg and token_symbol in cfg.get("assets", {}):
-        return cfg["assets"][token_symbol].get("decimals", 18)
+    if cfg:
+        asset = cfg.get("assets", {}).get(token_symbol)
+        if asset:
+            return asset.get("decimals", 18)
 
     # Fallback to hardcoded values for backward compatibility
-    if token_symbol.startswith("USDC") or token_symbol.startswith("USDT"):
-        return 6
-    elif token_symbol == "WBTC":
-        return 8
-    elif token_symbol == "EURS":
-        return 2
-    else:
-        return 18
+    decimals = _DECIMALS.get(token_symbol)
+    if decimals is None:
+        decimals = 6 if token_symbol.startswith(("USDC", "USDT")) else 18
+    return decimals
 
 
 def format_token_amount(amount_wei: int, token_symbol: str, cfg=None) -> float:
     """Convert token amount from wei to human-readable format."""
     decimals = get_token_decimals(token_symbol, cfg)
-    return round(amount_wei / (10 ** decimals), 6)
+    return round(amount_wei / _POW10[decimals], 6)
 
 
-def amount_to_wei(amount: float, token_symbol: str, cfg=None) -> int:
-    """Convert human-readable token amount to wei."""
+def amount_to_wei(amount: Decimal | float, token_symbol: str, cfg=None) -> int:
+    """Convert human-readable token amount to wei.
+
+    Scales the amount's decimal representation exactly (1.1 ETH -> 1100000000000000000)
+    instead of multiplying the binary float, which would yield 1100000000000000128.
+    Request amounts already arrive as Decimal, so only legacy float callers pay for str().
+    """
     decimals = get_token_decimals(token_symbol, cfg)
-    return int(amount * 10 ** decimals)
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    return int(amount.scaleb(decimals, _WEI_CONTEXT))
 
 
+@functools.lru_cache(maxsize=1024)
 def validate_user_address(address: str) -> str:
-    """Validate and convert user address to checksum format."""
-    return Web3.to_checksum_address(address)
+    """Validate and convert user address to checksum format (memoized per input string)."""
+    return to_checksum_address(address)
+
+
+def get_next_nonce(w3, address: str) -> int:
+    """Get the next nonce for an address from the node's pending transaction count.
+
+    Read fresh on every build: the service only builds transactions, so a quote the
+    user never signs must not push the next quote's nonce past a gap.
+    """
+    return call_with_retry(lambda: w3.eth.get_transaction_count(address, "pending"))
+
+
+# Fixed gas limits per operation so built transactions never need an eth_estimateGas round-trip.
+GAS_LIMITS = {
+    "supply": 300000,
+    "supplyWithPermit": 350000,  # supply plus the token's permit() call
+    "borrow": 400000,  # Borrow operations might need more gas
+    "repay": 350000,
+    "approve": 50000,  # Standard approval gas limit
+}
 
 
-def build_transaction(w3, user_address: str, chain_id: int, gas_limit: int = 300000,
-                     to: str = None, data: str = "0x", value: int = 0) -> dict:
+def build_transaction(w3, user_address: str, chain_id: int, gas_limit: int = GAS_LIMITS["supply"],
+                     to: str = None, data: str = "0x", value: int = 0, nonce: int = None) -> dict:
     """Build a basic transaction template for user to sign."""
     return {
         "from": user_address,
         "to": to,
-        "nonce": w3.eth.get_transaction_count(user_address),
+        "nonce": get_next_nonce(w3, user_address) if nonce is None else nonce,
         "chainId": chain_id,
         "gas": gas_limit,
         "data": data,
         "value": value,
+        **get_fee_params(w3),
     }
 
 
 def build_approval_transaction(w3, user_address: str, token_address: str,
-                              spender_address: str, amount: int, chain_id: int) -> dict:
+                              spender_address: str, amount: int, chain_id: int, nonce: int = None) -> dict:
     """Build ERC20 approval transaction for user to sign."""
     # ERC20 approve function signature: approve(address,uint256)
     # Method ID: 0x095ea7b3
-    # Parameters: spender (32 bytes), amount (32 bytes)
-    method_id = "0x095ea7b3"
-    spender_padded = spender_address[2:].zfill(64)  # Remove 0x and pad to 64 chars
-    amount_padded = hex(amount)[2:].zfill(64)  # Convert to hex, remove 0x, pad to 64 chars
-    data = method_id + spender_padded + amount_padded
+    # Parameters: spender (32 bytes), amount (32 bytes), each as 64 zero-padded hex chars
+    data = f"0x095ea7b3{int(spender_address, 16):064x}{amount:064x}"
 
     return build_transaction(
         w3=w3,
@@ -100,37 +308,96 @@ def build_approval_transaction(w3, user_address: str, token_address: str,
         chain_id=chain_id,
         to=token_address,
         data=data,
-        gas_limit=50000  # Standard approval gas limit
+        gas_limit=GAS_LIMITS["approve"],
+        nonce=nonce
     )
 
 
+# Gas price is reused for GAS_PRICE_CACHE_TTL seconds per Web3 connection
+GAS_PRICE_CACHE_TTL = 5
+_gas_price_cache = {}
+
+# EIP-1559 fee parameters are reused for FEE_PARAMS_CACHE_TTL seconds per Web3 connection
+FEE_PARAMS_CACHE_TTL = 2
+FEE_PRIORITY_PERCENTILE = 50
+MIN_PRIORITY_FEE = 10**6  # 0.001 gwei floor for testnets whose blocks carry no tips
+_fee_params_cache = {}
+
+# ERC20 allowance(address,address) / balanceOf(address) selectors
+ALLOWANCE_SELECTOR = "0xdd62ed3e"
+BALANCE_OF_SELECTOR = "0x70a08231"
+
+MAX_UINT256 = 2**256 - 1
+
+
+def get_gas_price(w3) -> int:
+    """Get the current gas price in wei, cached for a few seconds per connection."""
+    cached = _gas_price_cache.get(w3)
+    if cached and time.time() - cached[0] < GAS_PRICE_CACHE_TTL:
+        return cached[1]
+
+    gas_price = call_with_retry(lambda: w3.eth.gas_price)
+    _gas_price_cache[w3] = (time.time(), gas_price)
+    return gas_price
+
+
+def get_fee_params(w3) -> dict:
+    """Get type-2 fee fields (maxFeePerGas / maxPriorityFeePerGas) from one eth_feeHistory call.
+
+    Cached for a couple of seconds per connection. Explicit fee fields keep signers from
+    re-querying the gas price and from falling back to a legacy (type-0) transaction.
+    """
+    cached = _fee_params_cache.get(w3)
+    if cached and time.time() - cached[0] < FEE_PARAMS_CACHE_TTL:
+        return cached[1]
+
+    try:
+        history = call_with_retry(lambda: w3.eth.fee_history(1, "latest", [FEE_PRIORITY_PERCENTILE]))
+        next_base_fee = history["baseFeePerGas"][-1]
+        priority_fee = max(history["reward"][0][0], MIN_PRIORITY_FEE)
+        fee_params = {
+            "type": 2,  # EIP-1559 dynamic-fee transaction
+            "maxFeePerGas": next_base_fee * 2 + priority_fee,  # Headroom for base fee increases over the next blocks
+            "maxPriorityFeePerGas": priority_fee,
+        }
+    except Exception as e:
+        # Node without eth_feeHistory - fall back to a legacy gas price
+        logger.warning("eth_feeHistory unavailable, using legacy gas price: %s", e)
+        fee_params = {"gasPrice": get_gas_price(w3)}
+    _fee_params_cache[w3] = (time.time(), fee_params)
+    return fee_params
+
+
 def estimate_gas_cost(w3, gas_limit: int) -> float:
     """Estimate gas cost in native token (ETH, MATIC, etc.)."""
     try:
-        gas_price = w3.eth.gas_price
+        gas_price = get_gas_price(w3)
         gas_cost_wei = gas_limit * gas_price
         return float(w3.from_wei(gas_cost_wei, 'ether'))
     except Exception:
         return 0.0
 
 
+def _decode_uint256(data: bytes) -> int:
+    """Decode a single uint256 return value (0 for empty return data)."""
+    return int.from_bytes(data, "big")
+
+
+def build_allowance_call(token_address: str, owner_address: str, spender_address: str) -> tuple:
+    """Build an ERC20 allowance read as (target, calldata, decode_fn) for execute_call / execute_multicall."""
+    calldata = f"{ALLOWANCE_SELECTOR}{int(owner_address, 16):064x}{int(spender_address, 16):064x}"
+    return token_address, calldata, _decode_uint256
+
+
+def build_balance_call(token_address: str, owner_address: str) -> tuple:
+    """Build an ERC20 balanceOf read as (target, calldata, decode_fn) for execute_call / execute_multicall."""
+    calldata = f"{BALANCE_OF_SELECTOR}{int(owner_address, 16):064x}"
+    return token_address, calldata, _decode_uint256
+
+
 def get_token_allowance(w3, token_address: str, owner_address: str, spender_address: str) -> int:
     """Get ERC20 token allowance."""
     try:
-        # ERC20 allowance function signature
-        allowance_abi = [
-            {
-                "constant": True,
-                "inputs": [
-                    {"name": "_owner", "type": "address"},
-                    {"name": "_spender", "type": "address"}
-                ],
-                "name": "allowance",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "type": "function"
-            }
-        ]
-        token_contract = w3.eth.contract(address=token_address, abi=allowance_abi)
-        return token_contract.functions.allowance(owner_address, spender_address).call()
+        return execute_call(w3, build_allowance_call(token_address, owner_address, spender_address))
     except Exception:
-        return 0
\ No newline at end of file
+        return 0